@@ -6,6 +6,7 @@ Main application that orchestrates the bot, automation tasks, and GUI.
 
 import asyncio
 import argparse
+import logging
 import threading
 import sys
 
@@ -15,6 +16,73 @@ from network.client import MagicGardenClient
 from automation import harvest, pets, shop
 
 
+def create_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Create a new event loop for the bot.
+
+    Uses uvloop when it is installed (it is not available on Windows),
+    otherwise falls back to the default asyncio loop.
+
+    Returns:
+        A new event loop
+    """
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+def run_in_new_loop(coro):
+    """
+    Run a coroutine to completion on a fresh event loop for this thread.
+
+    Like asyncio.run, Ctrl-C cancels the coroutine so its cleanup still runs,
+    and remaining tasks and async generators are shut down before the loop
+    closes.
+
+    Args:
+        coro: Coroutine to run
+    """
+    if sys.version_info < (3, 11):
+        # asyncio.Runner (and its loop_factory) is 3.11+; use the default loop
+        asyncio.run(coro)
+        return
+
+    with asyncio.Runner(loop_factory=create_event_loop) as runner:
+        runner.run(coro)
+
+
+class ConsoleLogHandler(logging.StreamHandler):
+    """
+    Log handler that always writes to the current sys.stdout.
+
+    The GUIs replace sys.stdout with a console redirector after startup, so
+    the stream is resolved on every record instead of once at construction.
+    """
+
+    def emit(self, record):
+        self.stream = sys.stdout
+        super().emit(record)
+
+
+def configure_logging(verbose: bool = False):
+    """
+    Configure root logging for the bot.
+
+    Args:
+        verbose: If True, show per-item debug messages from automation tasks
+    """
+    handler = ConsoleLogHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    root = logging.getLogger()
+    root.addHandler(handler)
+    root.setLevel(logging.DEBUG if verbose else logging.INFO)
+
+
 def parse_args():
     """
     Parse command line arguments.
@@ -36,6 +104,9 @@ def parse_args():
         default="qt",
         help="Choose UI framework (default: qt)",
     )
+    parser.add_argument(
+        "--verbose", action="store_true", help="Show per-item automation details"
+    )
     return parser.parse_args()
 
 
@@ -62,15 +133,31 @@ async def run_bot(config, game_state, headless=False, client_holder=None):
         lambda: harvest.run_auto_harvest(client, game_state, config.harvest)
     )
 
-    # Only register pet automation tasks if enabled
+    # Register periodic actions on the client's shared scheduler. Initial
+    # delays give the game state time to load after connecting.
     if config.pet_food.feeding_enabled:
-        client.register_task(
-            lambda: pets.run_pet_feeder(client, game_state, config.pet_food)
+        client.register_periodic(
+            lambda: pets.feed_hungry_pets(client, game_state, config.pet_food),
+            5.0,
+            initial_delay=15.0,
+            name="pet feeding",
         )
     if config.pet_food.movement_enabled:
-        client.register_task(lambda: pets.run_pet_mover(client, game_state))
+        # Pet positions are sent every second once startup has seeded them
+        client.register_periodic(
+            lambda: pets.move_pets_randomly(client, game_state),
+            1.0,
+            initial_delay=9.0,
+            name="pet movement",
+        )
 
-    client.register_task(lambda: shop.run_shop_buyer(client, game_state, config.shop))
+    shop_interval = config.shop.check_interval_seconds if config.shop else 10
+    client.register_periodic(
+        lambda: shop.check_and_buy_from_shop(client, game_state, config.shop),
+        shop_interval,
+        initial_delay=10 + shop_interval,
+        name="shop buying",
+    )
 
     # Run client
     await client.run()
@@ -79,6 +166,7 @@ async def run_bot(config, game_state, headless=False, client_holder=None):
 def main():
     """Application entry point."""
     args = parse_args()
+    configure_logging(args.verbose)
 
     # Load config
     try:
@@ -99,7 +187,7 @@ def main():
     if args.headless:
         # Headless mode
         print("Running in headless mode (no GUI)")
-        asyncio.run(run_bot(config, game_state, headless=True))
+        run_in_new_loop(run_bot(config, game_state, headless=True))
     else:
         # GUI mode - choose UI framework
         if args.ui == "qt":
@@ -119,9 +207,7 @@ def main():
 
             # Run websocket in thread
             def run_websocket_thread():
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                loop.run_until_complete(run_bot(config, game_state, headless=False, client_holder=client_holder))
+                run_in_new_loop(run_bot(config, game_state, headless=False, client_holder=client_holder))
 
             ws_thread = threading.Thread(target=run_websocket_thread, daemon=True)
             ws_thread.start()
@@ -140,9 +226,7 @@ def main():
 
             # Run websocket in thread
             def run_websocket_thread():
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                loop.run_until_complete(run_bot(config, game_state, headless=False))
+                run_in_new_loop(run_bot(config, game_state, headless=False))
 
             ws_thread = threading.Thread(target=run_websocket_thread, daemon=True)
             ws_thread.start()
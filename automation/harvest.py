@@ -5,29 +5,31 @@ Handles finding, harvesting, and replanting crops automatically.
 """
 
 import asyncio
+import logging
 import time
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, Iterator, List
 
 from game_state import GameState
 from config import HarvestConfig
 
+logger = logging.getLogger(__name__)
 
-async def find_harvestable_plant(
-    slot_data: Dict[str, Any], species: str, min_mutations: int = 3
-) -> Tuple[Optional[int], Optional[int]]:
+
+def iter_harvestable_plants(
+    slot_data: Dict[str, Any], species: str, min_mutations: int, current_time: int
+) -> Iterator[Tuple[int, int, List[str]]]:
     """
-    Find a ready-to-harvest plant of the specified species.
+    Yield ready-to-harvest plants of the specified species.
 
     Args:
         slot_data: Player's slot data containing garden
         species: Plant species to find
-        min_mutations: Minimum mutation count required (default: 3)
+        min_mutations: Minimum mutation count required
+        current_time: Current time in milliseconds
 
-    Returns:
-        Tuple of (tile_id, slot_index) if found, else (None, None)
+    Yields:
+        Tuples of (tile_id, slot_index, mutations)
     """
-    current_time = int(time.time() * 1000)
-
     garden_data = slot_data.get("garden", {})
     tile_objects = garden_data.get("tileObjects", {})
 
@@ -37,20 +39,38 @@ async def find_harvestable_plant(
 
         slots = tile_obj.get("slots", [])
         for slot_index, plant_slot in enumerate(slots):
-            if not plant_slot:
+            # Species is the most selective check, so reject on it first
+            if not plant_slot or plant_slot.get("species") != species:
                 continue
 
-            plant_species = plant_slot.get("species")
             end_time = plant_slot.get("endTime", 0)
             mutations = plant_slot.get("mutations", [])
 
-            # Check if this plant matches species and is ready to harvest
-            if (
-                plant_species == species
-                and current_time >= end_time
-                and len(mutations) >= min_mutations
-            ):
-                return int(tile_id), slot_index
+            # Check if this plant is ready to harvest
+            if current_time >= end_time and len(mutations) >= min_mutations:
+                yield int(tile_id), slot_index, mutations
+
+
+async def find_harvestable_plant(
+    slot_data: Dict[str, Any], species: str, min_mutations: int = 3
+) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Find a ready-to-harvest plant of the specified species.
+
+    Args:
+        slot_data: Player's slot data containing garden
+        species: Plant species to find
+        min_mutations: Minimum mutation count required (default: 3)
+
+    Returns:
+        Tuple of (tile_id, slot_index) if found, else (None, None)
+    """
+    current_time = time.time_ns() // 1_000_000
+
+    for tile_id, slot_index, _ in iter_harvestable_plants(
+        slot_data, species, min_mutations, current_time
+    ):
+        return tile_id, slot_index
 
     return None, None
 
@@ -77,7 +97,7 @@ async def harvest_and_replant(
     if tile_slot is None:
         return False
 
-    print(f"Found harvestable {species} at slot {tile_slot}")
+    logger.debug("Found harvestable %s at slot %s", species, tile_slot)
 
     # Harvest the crop
     harvest_message = {
@@ -129,45 +149,24 @@ async def find_and_harvest(
     Returns:
         True if successful, False otherwise
     """
-    current_time = int(time.time() * 1000)
-
-    garden_data = slot_data.get("garden", {})
-    tile_objects = garden_data.get("tileObjects", {})
+    current_time = time.time_ns() // 1_000_000
 
     # Default min mutations if not specified
     if min_mutations is None:
         min_mutations = 3
 
     # Find ALL harvestable plants of the specified species
-    harvestable_plants = []
-
-    for tile_id, tile_obj in tile_objects.items():
-        if not tile_obj or tile_obj.get("objectType") != "plant":
-            continue
-
-        slots = tile_obj.get("slots", [])
-        for slot_index, plant_slot in enumerate(slots):
-            if not plant_slot:
-                continue
-
-            plant_species = plant_slot.get("species")
-            end_time = plant_slot.get("endTime", 0)
-            mutations = plant_slot.get("mutations", [])
-
-            # Check if this plant matches species and is ready to harvest
-            if (
-                plant_species == species
-                and current_time >= end_time
-                and len(mutations) >= min_mutations
-            ):
-                harvestable_plants.append(
-                    {
-                        "tile_id": int(tile_id),
-                        "slot_index": slot_index,
-                        "mutation_count": len(mutations),
-                        "mutations": mutations,
-                    }
-                )
+    harvestable_plants = [
+        {
+            "tile_id": tile_id,
+            "slot_index": slot_index,
+            "mutation_count": len(mutations),
+            "mutations": mutations,
+        }
+        for tile_id, slot_index, mutations in iter_harvestable_plants(
+            slot_data, species, min_mutations, current_time
+        )
+    ]
 
     if not harvestable_plants:
         return False
@@ -188,8 +187,13 @@ async def find_and_harvest(
     slots_index = chosen_plant["slot_index"]
     mutation_count = chosen_plant["mutation_count"]
 
-    print(
-        f"Found harvestable {species} at tile {tile_slot}, slot {slots_index} (mutations: {mutation_count}, priority: {priority_msg})"
+    logger.debug(
+        "Found harvestable %s at tile %s, slot %s (mutations: %s, priority: %s)",
+        species,
+        tile_slot,
+        slots_index,
+        mutation_count,
+        priority_msg,
     )
 
     # Harvest the crop
@@ -241,13 +245,11 @@ async def run_auto_harvest(client, game_state: GameState, config: HarvestConfig)
                 await asyncio.sleep(config.check_interval_seconds)
                 continue
 
-            # Get player slot data
-            player_slot = game_state.get_player_slot()
-            if not player_slot:
-                await asyncio.sleep(config.check_interval_seconds)
-                continue
-
-            slot_data = player_slot.get("data", {})
+            # Live read-only view, not a copy. It stays valid across the awaits
+            # below only because patches are applied on this event-loop thread
+            # and each scan builds its candidate list before its first await.
+            # Never await inside a scan over slot_data.
+            slot_data, _ = game_state.get_player_slot_snapshot()
             if not slot_data:
                 await asyncio.sleep(config.check_interval_seconds)
                 continue
@@ -256,9 +258,10 @@ async def run_auto_harvest(client, game_state: GameState, config: HarvestConfig)
             harvested_any = False
 
             # Try to harvest each configured species
+            replant_species = set(config.species_to_replant)
             for species in config.species_to_harvest:
                 # Determine if this species should be replanted
-                should_replant = species in config.species_to_replant
+                should_replant = species in replant_species
 
                 # Keep harvesting this species until no more are ready
                 while True:
@@ -279,10 +282,8 @@ async def run_auto_harvest(client, game_state: GameState, config: HarvestConfig)
                             await asyncio.sleep(1.0)
 
                             # Refresh slot data after harvest to find more plants
-                            player_slot = game_state.get_player_slot()
-                            if player_slot:
-                                slot_data = player_slot.get("data", {})
-                            else:
+                            slot_data, _ = game_state.get_player_slot_snapshot()
+                            if not slot_data:
                                 break  # Can't continue without slot data
                         else:
                             # No more plants of this species ready to harvest
@@ -5,8 +5,9 @@ Handles pet feeding, movement, and initialization.
 """
 
 import asyncio
+import logging
 import random
-from copy import deepcopy
+from collections import defaultdict, deque
 from typing import Optional, Dict, Any
 
 from game_state import GameState
@@ -17,6 +18,7 @@ from utils.coordinates import (
 )
 from automation.harvest import find_and_harvest
 
+logger = logging.getLogger(__name__)
 
 # ========== Helper Functions ==========
 
@@ -101,6 +103,26 @@ def get_player_slot_data_for_pets(game_state: GameState) -> Optional[Dict[str, A
     return None
 
 
+def index_produce_by_species(items_list) -> Dict[str, deque]:
+    """
+    Build a lookup of produce item IDs keyed by species.
+
+    Args:
+        items_list: Inventory item list from slot data
+
+    Returns:
+        defaultdict mapping species to a deque of produce item IDs
+    """
+    produce_by_species = defaultdict(deque)
+    for item in items_list:
+        if item.get("itemType") == "Produce":
+            species = item.get("species")
+            item_id = item.get("id")
+            if species and item_id:
+                produce_by_species[species].append(item_id)
+    return produce_by_species
+
+
 # ========== Pet Initialization ==========
 
 
@@ -131,38 +153,34 @@ async def initialize_pets(client, game_state: GameState, wait_timeout: float = 1
     # Collect all pet positions to send in one message
     all_pet_positions = {}
 
-    for i, pet_slot in enumerate(pet_slots):
-        if pet_slot:
-            pet_id = pet_slot.get("id")
-            if pet_id:
-                # NOTE: On first connect the server never publishes pet positions in
-                # userSlots, so without sending an initial PetPositions packet they
-                # would remain "inside" and completely invisible. We intentionally
-                # seed each pet at a random local coordinate so the client sends a
-                # position update and the pets appear immediately.
-                local_pos = {
-                    "x": random.randint(0, 22),
-                    "y": random.randint(0, 11),
-                }
-
-                server_pos = convert_local_to_server_coords(
-                    local_pos["x"], local_pos["y"], game_state
-                )
-                if not server_pos:
-                    continue
-
-                # Add to collection
-                all_pet_positions[pet_id] = server_pos
-
-                print(
-                    "Initialized pet {} at local ({}, {}) -> server ({}, {})".format(
-                        pet_id[:8],
-                        local_pos["x"],
-                        local_pos["y"],
-                        server_pos["x"],
-                        server_pos["y"],
-                    )
-                )
+    live_pet_ids = [
+        pet_slot["id"] for pet_slot in pet_slots if pet_slot and pet_slot.get("id")
+    ]
+
+    for pet_id in live_pet_ids:
+        # NOTE: On first connect the server never publishes pet positions in
+        # userSlots, so without sending an initial PetPositions packet they
+        # would remain "inside" and completely invisible. We intentionally
+        # seed each pet at a random local coordinate so the client sends a
+        # position update and the pets appear immediately.
+        local_x = random.randint(0, 22)
+        local_y = random.randint(0, 11)
+
+        server_pos = convert_local_to_server_coords(local_x, local_y, game_state)
+        if not server_pos:
+            continue
+
+        # Add to collection
+        all_pet_positions[pet_id] = server_pos
+
+        logger.debug(
+            "Initialized pet %s at local (%s, %s) -> server (%s, %s)",
+            pet_id[:8],
+            local_x,
+            local_y,
+            server_pos["x"],
+            server_pos["y"],
+        )
 
     # Send a single PetPositions message with all pets
     if all_pet_positions:
@@ -214,27 +232,21 @@ async def move_pets_randomly(
     MIN_X, MAX_X = 0, 22
     MIN_Y, MAX_Y = 0, 11
 
-    slot_data = get_player_slot_data_for_pets(game_state)
+    # petSlotInfos is at the slot level, not in slot['data'], so fetch both
+    # in a single locked pass
+    slot_data, pet_slot_infos = game_state.get_player_slot_snapshot()
     if not slot_data:
         slot = await wait_for_user_slot(
             game_state, require_data=True, timeout=wait_timeout
         )
         if not slot:
             return
-        slot_data = slot.get("data", {})
+        slot_data, pet_slot_infos = game_state.get_player_slot_snapshot()
         if not slot_data:
             return
 
-    # petSlotInfos is at the slot level, not in slot['data']
-    # Get it from the slot directly
-    slot = find_player_user_slot(game_state)
-    if not slot:
-        return
-
-    pet_slot_infos = slot.get("petSlotInfos", {})
-
-    # If petSlotInfos is not a dict or is empty, nothing to send yet
-    if not isinstance(pet_slot_infos, dict) or not pet_slot_infos:
+    # If petSlotInfos is empty, nothing to send yet
+    if not pet_slot_infos:
         return
 
     pet_slots = slot_data.get("petSlots", [])
@@ -256,56 +268,43 @@ async def move_pets_randomly(
         if x is None or y is None:
             continue
 
-        server_pos = {"x": int(x), "y": int(y)}
+        server_x, server_y = int(x), int(y)
 
         # Convert to local coordinates for movement logic
-        local_coords = convert_server_to_local_coords(
-            server_pos["x"], server_pos["y"], game_state
-        )
+        local_coords = convert_server_to_local_coords(server_x, server_y, game_state)
         if not local_coords:
             # If we can't convert, just use the server position as-is
-            all_pet_positions[pet_id] = server_pos
+            all_pet_positions[pet_id] = {"x": server_x, "y": server_y}
             continue
 
-        pos = {"x": local_coords["x"], "y": local_coords["y"]}
+        local_x, local_y = local_coords["x"], local_coords["y"]
 
         # Each pet has different movement probability
         move_chance = random.random()
 
-        new_pos = pos.copy()
-
         if move_chance < 0.2:  # 20% chance to move per update
-            # Build list of valid directions (away from walls)
-            valid_directions = []
-            if pos["y"] > MIN_Y:
-                valid_directions.append("up")
-            if pos["y"] < MAX_Y:
-                valid_directions.append("down")
-            if pos["x"] > MIN_X:
-                valid_directions.append("left")
-            if pos["x"] < MAX_X:
-                valid_directions.append("right")
+            # Build list of valid (dx, dy) steps (away from walls)
+            valid_steps = []
+            if local_y > MIN_Y:
+                valid_steps.append((0, -1))  # up
+            if local_y < MAX_Y:
+                valid_steps.append((0, 1))  # down
+            if local_x > MIN_X:
+                valid_steps.append((-1, 0))  # left
+            if local_x < MAX_X:
+                valid_steps.append((1, 0))  # right
 
             # If there are valid directions, choose one and move
-            if valid_directions:
-                direction = random.choice(valid_directions)
-
-                if direction == "up":
-                    new_pos["y"] -= 1
-                elif direction == "down":
-                    new_pos["y"] += 1
-                elif direction == "left":
-                    new_pos["x"] -= 1
-                elif direction == "right":
-                    new_pos["x"] += 1
+            if valid_steps:
+                dx, dy = random.choice(valid_steps)
+                local_x += dx
+                local_y += dy
 
         # Convert to server coordinates
-        new_server_pos = convert_local_to_server_coords(
-            new_pos["x"], new_pos["y"], game_state
-        )
+        new_server_pos = convert_local_to_server_coords(local_x, local_y, game_state)
         if not new_server_pos:
             # Fallback to original position if conversion fails
-            all_pet_positions[pet_id] = server_pos
+            all_pet_positions[pet_id] = {"x": server_x, "y": server_y}
             continue
 
         # Always add this pet's position (moved or not)
@@ -368,15 +367,7 @@ async def feed_hungry_pets(client, game_state: GameState, config: PetFoodConfig)
     items_list = inv_data.get("items", [])
 
     # Build produce lookup by species
-    produce_by_species = {}
-    for item in items_list:
-        if item.get("itemType") == "Produce":
-            species = item.get("species")
-            item_id = item.get("id")
-            if species and item_id:
-                if species not in produce_by_species:
-                    produce_by_species[species] = []
-                produce_by_species[species].append(item_id)
+    produce_by_species = index_produce_by_species(items_list)
 
     # Get pet food mappings from config (honor empty mapping - no defaults)
     pet_food_map = config.mapping if config else {}
@@ -403,11 +394,8 @@ async def feed_hungry_pets(client, game_state: GameState, config: PetFoodConfig)
             # Try each food in priority order
             for required_food in food_list:
                 # Check if we have the required produce in inventory
-                if (
-                    required_food in produce_by_species
-                    and produce_by_species[required_food]
-                ):
-                    crop_item_id = produce_by_species[required_food][0]
+                if produce_by_species.get(required_food):
+                    crop_item_id = produce_by_species[required_food].popleft()
 
                     # Send FeedPet action
                     feed_message = {
@@ -419,11 +407,6 @@ async def feed_hungry_pets(client, game_state: GameState, config: PetFoodConfig)
                     await client.send(feed_message)
                     print(f"Fed {pet_species} (ID: {pet_id[:8]}...) with {required_food}")
 
-                    # Remove the used produce from our lookup to avoid double-feeding
-                    produce_by_species[required_food].pop(0)
-                    if not produce_by_species[required_food]:
-                        del produce_by_species[required_food]
-
                     fed = True
                     break
                 else:
@@ -460,22 +443,11 @@ async def feed_hungry_pets(client, game_state: GameState, config: PetFoodConfig)
                         fresh_items_list = fresh_inv_data.get("items", [])
 
                         # Rebuild produce lookup with fresh inventory
-                        fresh_produce_by_species = {}
-                        for item in fresh_items_list:
-                            if item.get("itemType") == "Produce":
-                                species = item.get("species")
-                                item_id = item.get("id")
-                                if species and item_id:
-                                    if species not in fresh_produce_by_species:
-                                        fresh_produce_by_species[species] = []
-                                    fresh_produce_by_species[species].append(item_id)
+                        fresh_produce_by_species = index_produce_by_species(fresh_items_list)
 
                         # Now try to feed the pet with the newly harvested produce
-                        if (
-                            required_food in fresh_produce_by_species
-                            and fresh_produce_by_species[required_food]
-                        ):
-                            crop_item_id = fresh_produce_by_species[required_food][0]
+                        if fresh_produce_by_species.get(required_food):
+                            crop_item_id = fresh_produce_by_species[required_food].popleft()
 
                             # Send FeedPet action
                             feed_message = {
@@ -488,14 +460,8 @@ async def feed_hungry_pets(client, game_state: GameState, config: PetFoodConfig)
                             print(f"Fed {pet_species} (ID: {pet_id[:8]}...) with freshly harvested {required_food}")
 
                             # Update the main produce_by_species to reflect this usage
-                            # IMPORTANT: Use fresh_produce_by_species[required_food][1:] to get remaining items
-                            # This works even if required_food wasn't in produce_by_species before (empty inventory case)
-                            remaining_items = fresh_produce_by_species[required_food][1:]
-                            if remaining_items:
-                                produce_by_species[required_food] = remaining_items
-                            elif required_food in produce_by_species:
-                                # Only delete if it existed before; no need to delete what wasn't there
-                                del produce_by_species[required_food]
+                            # (the fed item was already popped from the fresh deque)
+                            produce_by_species[required_food] = fresh_produce_by_species[required_food]
 
                             fed = True
                             break
@@ -508,59 +474,3 @@ async def feed_hungry_pets(client, game_state: GameState, config: PetFoodConfig)
 
             if not fed:
                 print(f"Could not feed {pet_species} - no available food from priority list: {food_list}")
-
-
-# ========== Pet Tasks ==========
-
-
-async def run_pet_feeder(client, game_state: GameState, config: PetFoodConfig):
-    """
-    Pet feeding task that runs periodically.
-
-    Args:
-        client: MagicGardenClient instance
-        game_state: Global game state
-        config: Pet food configuration
-    """
-    try:
-        # Wait a bit before starting to allow game state to load
-        await asyncio.sleep(10)
-
-        while True:
-            await asyncio.sleep(5)  # Check every 5 seconds
-
-            try:
-                await feed_hungry_pets(client, game_state, config)
-            except Exception as e:
-                print(f"Error in pet feeding task: {e}")
-                # Continue on errors
-
-    except asyncio.CancelledError:
-        # Task cancelled due to disconnection
-        pass
-
-
-async def run_pet_mover(client, game_state: GameState):
-    """
-    Pet movement task that runs periodically.
-
-    Args:
-        client: MagicGardenClient instance
-        game_state: Global game state
-    """
-    try:
-        # Wait for startup task to complete pet initialization
-        await asyncio.sleep(8)
-
-        while True:
-            await asyncio.sleep(1)  # Send pet positions every second
-
-            try:
-                await move_pets_randomly(client, game_state)
-            except Exception as e:
-                print(f"Error in pet movement task: {e}")
-                # Continue on errors
-
-    except asyncio.CancelledError:
-        # Task cancelled due to disconnection
-        pass
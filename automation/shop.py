@@ -5,12 +5,14 @@ Handles automatic purchasing of configured items from shops.
 """
 
 import asyncio
-from copy import deepcopy
+import logging
 from typing import Dict, Any
 
 from game_state import GameState
 from config import ShopConfig
 
+logger = logging.getLogger(__name__)
+
 
 async def check_and_buy_from_shop(
     client, game_state: GameState, config: ShopConfig
@@ -26,13 +28,15 @@ async def check_and_buy_from_shop(
     if not config or not config.enabled:
         return
 
-    # Get player slot using GameState's method (handles locking internally)
-    our_slot = game_state.get_player_slot()
-    if not our_slot:
+    # Live read-only views, not copies. The purchase loops below await, so this
+    # is safe only because patches are applied on this event-loop thread and the
+    # buy lists are built from shops_data before the first await. Never await
+    # while scanning these views.
+    slot_data, _ = game_state.get_player_slot_snapshot()
+    if not slot_data:
         return
 
-    # Get full state (deepcopy) to extract shops data
-    full_state = game_state["full_state"]
+    full_state = game_state.get_full_state_snapshot()
     if not full_state:
         return
 
@@ -43,7 +47,6 @@ async def check_and_buy_from_shop(
     quinoa_state = full_state["child"].get("data", {})
     shops_data = quinoa_state.get("shops", {})
 
-    slot_data = our_slot.get("data", {})
     current_coins = slot_data.get("coinsCount", 0)
 
     # Check coin limits
@@ -84,11 +87,11 @@ async def check_and_buy_from_shop(
                     seeds_to_buy.append({"species": species, "stock": stock})
                 else:
                     if not config.seeds_enabled:
-                        print(
-                            f"   {species} (Seed) - seed buying disabled (Stock: {stock})"
+                        logger.debug(
+                            "   %s (Seed) - seed buying disabled (Stock: %s)", species, stock
                         )
                     else:
-                        print(f"   {species} (Seed) - not in config (Stock: {stock})")
+                        logger.debug("   %s (Seed) - not in config (Stock: %s)", species, stock)
 
     # Check egg shop
     egg_shop = shops_data.get("egg", {})
@@ -112,9 +115,9 @@ async def check_and_buy_from_shop(
                     eggs_to_buy.append({"eggId": egg_id, "stock": stock})
                 else:
                     if not config.eggs_enabled:
-                        print(f"   {egg_id} (Egg) - egg buying disabled (Stock: {stock})")
+                        logger.debug("   %s (Egg) - egg buying disabled (Stock: %s)", egg_id, stock)
                     else:
-                        print(f"   {egg_id} (Egg) - not in config (Stock: {stock})")
+                        logger.debug("   %s (Egg) - not in config (Stock: %s)", egg_id, stock)
 
     # Buy all configured seeds
     for seed_item in seeds_to_buy:
@@ -127,9 +130,8 @@ async def check_and_buy_from_shop(
         purchased_count = 0
         for i in range(stock):
             # Re-check balance before each purchase
-            our_slot = game_state.get_player_slot()
-            if our_slot:
-                slot_data = our_slot.get("data", {})
+            slot_data, _ = game_state.get_player_slot_snapshot()
+            if slot_data:
                 current_coins = slot_data.get("coinsCount", 0)
 
                 if current_coins <= min_coins:
@@ -189,9 +191,8 @@ async def check_and_buy_from_shop(
         purchased_count = 0
         for i in range(stock):
             # Re-check balance before each purchase
-            our_slot = game_state.get_player_slot()
-            if our_slot:
-                slot_data = our_slot.get("data", {})
+            slot_data, _ = game_state.get_player_slot_snapshot()
+            if slot_data:
                 current_coins = slot_data.get("coinsCount", 0)
 
                 if current_coins <= min_coins:
@@ -249,33 +250,3 @@ async def check_and_buy_from_shop(
         print(
             f"   Purchased {items_bought} item(s) and returned to original position"
         )
-
-
-async def run_shop_buyer(client, game_state: GameState, config: ShopConfig):
-    """
-    Shop auto-buy task that runs periodically.
-
-    Args:
-        client: MagicGardenClient instance
-        game_state: Global game state
-        config: Shop configuration
-    """
-    # Wait a bit before starting to allow game state to load
-    await asyncio.sleep(10)
-
-    try:
-        # Get check interval from config
-        interval = config.check_interval_seconds if config else 10
-
-        while True:
-            await asyncio.sleep(interval)
-
-            try:
-                await check_and_buy_from_shop(client, game_state, config)
-            except Exception as e:
-                print(f"Error in shop buying task: {e}")
-                # Continue on errors
-
-    except asyncio.CancelledError:
-        # Task cancelled due to disconnection
-        pass
@@ -4,14 +4,18 @@ Configuration management for Magic Garden bot.
 Handles loading, saving, and validation of bot configuration from bot_config.json.
 """
 
-import json
+import atexit
 import os
 import secrets
+import threading
+import time
 from copy import deepcopy
 from dataclasses import dataclass
+from itertools import islice
 from typing import Dict, List, Optional, Any
 
 from utils.constants import CONFIG_FILE
+from utils import json_codec
 
 
 @dataclass
@@ -63,6 +67,37 @@ class BotConfig:
     shop: ShopConfig
     pet_food: PetFoodConfig
     reconnection: ReconnectionConfig
+    message_log_enabled: bool  # Whether to write websocket traffic to messages.log
+    message_log_pretty: bool  # Whether to re-indent JSON in messages.log
+
+
+_HARVEST_DEFAULTS = {
+    "enabled": False,
+    "species": [],
+    "species_to_replant": [],
+    "min_mutations": 3,
+    "check_interval_seconds": 30,
+}
+
+_RECONNECTION_DEFAULTS = {
+    "max_retries": 5,
+    "base_delay": 5,
+    "max_delay": 60,
+}
+
+
+def apply_defaults(target: Dict[str, Any], defaults: Dict[str, Any]) -> bool:
+    """Fill keys missing from target with copies of the defaults.
+
+    Returns:
+        True if any key was added.
+    """
+    added = False
+    for key, value in defaults.items():
+        if key not in target:
+            target[key] = deepcopy(value)
+            added = True
+    return added
 
 
 def get_default_shop_config():
@@ -79,38 +114,129 @@ def get_default_shop_config():
 
 
 def normalize_shop_config(raw_config):
-    """Ensure the shop config has all expected keys and sane defaults."""
-    default_config = get_default_shop_config()
+    """Ensure the shop config has all expected keys and sane defaults.
+
+    Returns:
+        Tuple of (normalized_config, changed), where changed is True if the
+        normalized config differs from raw_config.
+    """
+    # get_default_shop_config() builds a fresh literal, so no copy is needed
+    normalized = get_default_shop_config()
 
     if not isinstance(raw_config, dict):
-        return default_config
+        return normalized, True
 
-    normalized = deepcopy(default_config)
+    # Unknown keys are dropped, which counts as a change
+    changed = not raw_config.keys() <= normalized.keys()
 
     for key in ("enabled", "check_interval_seconds", "min_coins_to_keep"):
         if key in raw_config:
             normalized[key] = raw_config[key]
+        else:
+            changed = True
 
     raw_items = raw_config.get("items_to_buy")
     if isinstance(raw_items, dict):
+        if not raw_items.keys() <= normalized["items_to_buy"].keys():
+            changed = True
         for bucket in normalized["items_to_buy"].keys():
             bucket_data = raw_items.get(bucket)
-            if isinstance(bucket_data, dict):
-                if "enabled" in bucket_data:
-                    normalized["items_to_buy"][bucket]["enabled"] = bucket_data[
-                        "enabled"
-                    ]
+            if not isinstance(bucket_data, dict):
+                changed = True
+                continue
+            if not bucket_data.keys() <= {"enabled", "items"}:
+                changed = True
+
+            if "enabled" in bucket_data:
+                normalized["items_to_buy"][bucket]["enabled"] = bucket_data[
+                    "enabled"
+                ]
+            else:
+                changed = True
+
+            bucket_items = bucket_data.get("items")
+            if isinstance(bucket_items, list):
+                normalized["items_to_buy"][bucket]["items"] = bucket_items
+            else:
+                changed = True
+    else:
+        changed = True
+
+    return normalized, changed
 
-                bucket_items = bucket_data.get("items")
-                if isinstance(bucket_items, list):
-                    normalized["items_to_buy"][bucket]["items"] = bucket_items
 
-    return normalized
+# (file key, config dict) for the last config read from or written to disk, so
+# repeated saves don't re-read and re-parse an unchanged file. Replaced as one
+# tuple so threads reading without _config_io_lock never pair a key with
+# another file version's data.
+_config_cache = (None, None)
+
+
+def _config_file_key():
+    """Return (inode, mtime_ns, size) for the config file, or None if missing."""
+    try:
+        st = os.stat(CONFIG_FILE)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _read_config_file() -> Dict[str, Any]:
+    """Read the raw config dict, reusing the cached copy if the file is unchanged.
+
+    Returns:
+        Config dict (empty if the file does not exist). The caller owns it.
+
+    Raises:
+        ValueError/OSError: If the file exists but cannot be read or parsed.
+    """
+    global _config_cache
+    key = _config_file_key()
+    if key is None:
+        return {}
+    cached_key, cached_data = _config_cache
+    if key == cached_key:
+        return deepcopy(cached_data)
+
+    try:
+        with open(CONFIG_FILE, "rb") as f:
+            config = json_codec.loads(f.read())
+    except FileNotFoundError:
+        # Removed between the stat and the open
+        return {}
+
+    _config_cache = (key, deepcopy(config))
+    return config
+
+
+def _write_config_file(config: Dict[str, Any]):
+    """Atomically write the config dict and refresh the cache."""
+    global _config_cache
+    # Encode before opening so the file is only held open for the write itself
+    data = json_codec.dumps(config, pretty=True)
+    tmp_path = CONFIG_FILE + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        # Make sure the contents hit disk before the rename makes them visible
+        os.fsync(f.fileno())
+    os.replace(tmp_path, CONFIG_FILE)
+
+    _config_cache = (_config_file_key(), deepcopy(config))
 
 
 def generate_id(alphabet, length):
     """Generate a random ID from the given alphabet."""
-    return "".join(secrets.choice(alphabet) for _ in range(length))
+    # Draw random bytes in bulk and keep only those below the largest multiple
+    # of the alphabet size, so the modulo doesn't bias the character choice
+    size = len(alphabet)
+    limit = 256 - 256 % size
+    chars = []
+    while len(chars) < length:
+        chars.extend(
+            alphabet[b % size] for b in secrets.token_bytes(length * 2) if b < limit
+        )
+    return "".join(chars[:length])
 
 
 def generate_player_id():
@@ -128,13 +254,10 @@ def load_config() -> BotConfig:
     Raises:
         RuntimeError: If cookies are missing from config.
     """
-    config = {}
-    if os.path.exists(CONFIG_FILE):
-        try:
-            with open(CONFIG_FILE, "r") as f:
-                config = json.load(f)
-        except Exception:
-            config = {}
+    try:
+        config = _read_config_file()
+    except Exception:
+        config = {}
 
     config_dirty = False
 
@@ -150,30 +273,12 @@ def load_config() -> BotConfig:
     if isinstance(ready_config, dict):
         harvest_config = ready_config
     else:
-        harvest_config = {
-            "enabled": False,
-            "species": [],
-            "min_mutations": 3,
-            "check_interval_seconds": 30
-        }
+        harvest_config = {}
         config["ready_to_harvest"] = harvest_config
         config_dirty = True
 
     # Ensure all harvest config keys exist with defaults
-    if "enabled" not in harvest_config:
-        harvest_config["enabled"] = False
-        config_dirty = True
-    if "species" not in harvest_config:
-        harvest_config["species"] = []
-        config_dirty = True
-    if "species_to_replant" not in harvest_config:
-        harvest_config["species_to_replant"] = []
-        config_dirty = True
-    if "min_mutations" not in harvest_config:
-        harvest_config["min_mutations"] = 3
-        config_dirty = True
-    if "check_interval_seconds" not in harvest_config:
-        harvest_config["check_interval_seconds"] = 30
+    if apply_defaults(harvest_config, _HARVEST_DEFAULTS):
         config_dirty = True
 
     print(f"Loaded harvest config: Auto-harvest enabled = {harvest_config.get('enabled', False)}")
@@ -184,8 +289,8 @@ def load_config() -> BotConfig:
         print(f"  Check interval: {harvest_config.get('check_interval_seconds', 30)}s")
 
     # Shop config
-    normalized_shop = normalize_shop_config(config.get("shop"))
-    if normalized_shop != config.get("shop"):
+    normalized_shop, shop_changed = normalize_shop_config(config.get("shop"))
+    if shop_changed:
         config["shop"] = normalized_shop
         config_dirty = True
 
@@ -228,20 +333,25 @@ def load_config() -> BotConfig:
     if isinstance(pet_food_raw, dict):
         # Normalize pet food config to use lists
         # Convert old format {"Bee": "OrangeTulip"} to new format {"Bee": ["OrangeTulip"]}
-        pet_food_config = {}
-        for pet_species, food_value in pet_food_raw.items():
+        # Only copy the mapping once an entry actually needs converting
+        pet_food_config = pet_food_raw
+        for index, (pet_species, food_value) in enumerate(pet_food_raw.items()):
             if isinstance(food_value, list):
                 # Already in new format
-                pet_food_config[pet_species] = food_value
-            elif isinstance(food_value, str):
+                if pet_food_config is not pet_food_raw:
+                    pet_food_config[pet_species] = food_value
+                continue
+
+            if pet_food_config is pet_food_raw:
+                pet_food_config = dict(islice(pet_food_raw.items(), index))
+
+            if isinstance(food_value, str):
                 # Convert old format (single string) to new format (list)
                 pet_food_config[pet_species] = [food_value]
-            else:
-                # Invalid format, skip this entry
-                continue
+            # Invalid format: skip this entry
 
         # Update config if normalization changed anything
-        if pet_food_config != pet_food_raw:
+        if pet_food_config is not pet_food_raw:
             config["pet_food_mapping"] = pet_food_config
             config_dirty = True
     else:
@@ -262,9 +372,9 @@ def load_config() -> BotConfig:
     reconnection_config = config.get("reconnection")
     if isinstance(reconnection_config, dict):
         # Validate and normalize values
-        max_retries = reconnection_config.get("max_retries", 5)
-        base_delay = reconnection_config.get("base_delay", 5)
-        max_delay = reconnection_config.get("max_delay", 60)
+        max_retries = reconnection_config.get("max_retries", _RECONNECTION_DEFAULTS["max_retries"])
+        base_delay = reconnection_config.get("base_delay", _RECONNECTION_DEFAULTS["base_delay"])
+        max_delay = reconnection_config.get("max_delay", _RECONNECTION_DEFAULTS["max_delay"])
 
         # Ensure values are within reasonable bounds
         max_retries = max(0, min(max_retries, 100))  # 0-100 retries
@@ -278,11 +388,7 @@ def load_config() -> BotConfig:
         }
     else:
         # Default reconnection config
-        reconnection_config_normalized = {
-            "max_retries": 5,
-            "base_delay": 5,
-            "max_delay": 60
-        }
+        reconnection_config_normalized = dict(_RECONNECTION_DEFAULTS)
         config["reconnection"] = reconnection_config_normalized
         config_dirty = True
 
@@ -318,11 +424,23 @@ def load_config() -> BotConfig:
 
     print(f"Loaded room search config: search_main_rooms={search_main_rooms}")
 
+    # Message logging (on by default, matching earlier releases)
+    message_log_enabled = config.get("message_log_enabled")
+    if message_log_enabled is None:
+        message_log_enabled = True
+        config["message_log_enabled"] = True
+        config_dirty = True
+
+    message_log_pretty = config.get("message_log_pretty")
+    if message_log_pretty is None:
+        message_log_pretty = False
+        config["message_log_pretty"] = False
+        config_dirty = True
+
     # Save if modified
     if config_dirty:
         try:
-            with open(CONFIG_FILE, "w") as f:
-                json.dump(config, f, indent=2)
+            _write_config_file(config)
         except Exception:
             pass
 
@@ -369,42 +487,82 @@ def load_config() -> BotConfig:
         shop=shop_config_obj,
         pet_food=pet_food_config_obj,
         reconnection=reconnection_config_obj,
+        message_log_enabled=message_log_enabled,
+        message_log_pretty=message_log_pretty,
     )
 
 
-def save_last_room(room_id: str):
-    """Save the last connected room to config."""
-    try:
-        if os.path.exists(CONFIG_FILE):
-            with open(CONFIG_FILE, "r") as f:
-                config = json.load(f)
-        else:
-            config = {}
+# ========== Deferred Config Updates ==========
 
-        config["room_id"] = room_id
+# Saves from the bot (cookies, last room) are coalesced per key and written
+# by a background thread after a short quiet period, so the event loop never
+# blocks on file I/O and bursts of reconnects produce a single write.
+_SAVE_DEBOUNCE_SECONDS = 2.0
 
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(config, f, indent=2)
-    except Exception:
-        pass
+_pending_updates: Dict[str, Any] = {}
+_last_saved: Dict[str, Any] = {}  # Values known to be on disk, per key
+_pending_lock = threading.Lock()
+_config_io_lock = threading.Lock()
+_save_requested = threading.Event()
+_save_thread: Optional[threading.Thread] = None
+_MISSING = object()
 
 
-def save_cookies(cookies: str):
-    """Persist the latest cookie string to the config."""
-    try:
-        if os.path.exists(CONFIG_FILE):
-            with open(CONFIG_FILE, "r") as f:
-                config = json.load(f)
-        else:
-            config = {}
+def flush_config_updates():
+    """Write any pending config updates to disk now."""
+    with _config_io_lock:
+        with _pending_lock:
+            updates = dict(_pending_updates)
+            _pending_updates.clear()
+        if not updates:
+            return
+
+        try:
+            config = _read_config_file()
+
+            # Avoid rewriting the file if nothing changed
+            if any(config.get(key) != value for key, value in updates.items()):
+                config.update(updates)
+                _write_config_file(config)
+            _last_saved.update(updates)
+        except Exception:
+            pass
+
 
-        # Avoid rewriting the file if nothing changed
-        if config.get("cookies") == cookies:
+def _config_save_loop():
+    """Background loop that debounces and applies config updates."""
+    while True:
+        _save_requested.wait()
+        time.sleep(_SAVE_DEBOUNCE_SECONDS)
+        _save_requested.clear()
+        flush_config_updates()
+
+
+def _queue_config_update(key: str, value: Any):
+    """Record the latest value for a config key and schedule a write."""
+    global _save_thread
+
+    with _pending_lock:
+        # Skip the wake-up entirely if this value is already saved
+        if key not in _pending_updates and _last_saved.get(key, _MISSING) == value:
             return
+        _pending_updates[key] = value
+        if _save_thread is None:
+            _save_thread = threading.Thread(
+                target=_config_save_loop, name="config-writer", daemon=True
+            )
+            _save_thread.start()
+    _save_requested.set()
 
-        config["cookies"] = cookies
 
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(config, f, indent=2)
-    except Exception:
-        pass
+atexit.register(flush_config_updates)
+
+
+def save_last_room(room_id: str):
+    """Save the last connected room to config (written in the background)."""
+    _queue_config_update("room_id", room_id)
+
+
+def save_cookies(cookies: str):
+    """Persist the latest cookie string to the config (written in the background)."""
+    _queue_config_update("cookies", cookies)
@@ -5,13 +5,70 @@ This module provides thread-safe state management for the bot, encapsulating
 player information, room state, positions, and connection statistics.
 """
 
+import sys
 import threading
 from copy import deepcopy
-from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from dataclasses import dataclass, fields, replace
+from typing import Optional, Dict, Any, Tuple
+
+from utils.json_codec import orjson  # None when orjson is not installed
+
+
+_IMMUTABLE_SCALARS = frozenset((str, int, float, bool, type(None)))
+
+
+def _clone_json(obj):
+    """Recursively copy dicts/lists, sharing immutable scalars."""
+    obj_type = type(obj)
+    if obj_type is dict:
+        return {
+            key: value if type(value) in _IMMUTABLE_SCALARS else _clone_json(value)
+            for key, value in obj.items()
+        }
+    if obj_type is list:
+        return [
+            value if type(value) in _IMMUTABLE_SCALARS else _clone_json(value)
+            for value in obj
+        ]
+    if obj_type in _IMMUTABLE_SCALARS:
+        return obj
+    return deepcopy(obj)
+
+
+def _clone_interned(obj):
+    """Like _clone_json, but interns dict keys so repeated keys share one string."""
+    obj_type = type(obj)
+    if obj_type is dict:
+        return {
+            (sys.intern(key) if type(key) is str else key): (
+                value if type(value) in _IMMUTABLE_SCALARS else _clone_interned(value)
+            )
+            for key, value in obj.items()
+        }
+    if obj_type is list:
+        return [
+            value if type(value) in _IMMUTABLE_SCALARS else _clone_interned(value)
+            for value in obj
+        ]
+    return _clone_json(obj)
+
+
+def _fast_clone(obj):
+    """Deep copy JSON-shaped game state much faster than copy.deepcopy.
+
+    Uses an orjson round-trip when available, otherwise a recursive copier
+    that skips deepcopy's memo dict and generic type dispatch. Data orjson
+    can't encode (e.g. non-string keys) falls back to the recursive copier.
+    """
+    if orjson is not None and type(obj) in (dict, list):
+        try:
+            return orjson.loads(orjson.dumps(obj))
+        except TypeError:
+            pass
+    return _clone_json(obj)
 
 
-@dataclass
+@dataclass(slots=True)
 class Statistics:
     """Connection statistics"""
     messages_received: int = 0
@@ -24,6 +81,28 @@ class Statistics:
     patches_applied: int = 0
 
 
+def _find_entry_index(entries, key: str, value, hint: Optional[int] = None) -> Optional[int]:
+    """Return the index of the first entry whose `key` equals `value`.
+
+    The `hint` index (usually a cached previous result) is checked first so
+    the steady-state lookup skips the scan.
+    """
+    if hint is not None and hint < len(entries):
+        entry = entries[hint]
+        if entry and entry.get(key) == value:
+            return hint
+    for idx, entry in enumerate(entries):
+        if entry and entry.get(key) == value:
+            return idx
+    return None
+
+
+# Integer Statistics fields that increment_stat() may bump
+_COUNTER_FIELDS = frozenset(
+    field.name for field in fields(Statistics) if field.type is int
+)
+
+
 class GameState:
     """Thread-safe game state manager
 
@@ -32,37 +111,63 @@ class GameState:
     dict-like access for gradual migration.
 
     Key features:
-    - Thread-safe access via RLock (reentrant lock)
+    - Thread-safe access via RLock (reentrant lock); getters for immutable
+      scalars skip the lock since a single attribute load is atomic under the GIL
+    - Positions and statistics have their own locks so frequent updates to
+      them don't wait on full_state copies
     - Type hints for better code clarity
     - Helper methods for common operations
     - Deep copying where appropriate to prevent race conditions
     """
 
+    __slots__ = (
+        "_lock",
+        "_pos_lock",
+        "_stats_lock",
+        "_player_id",
+        "_player_name",
+        "_room_id",
+        "_full_state",
+        "_player_x",
+        "_player_y",
+        "_user_slot_index",
+        "_pet_positions",
+        "_pet_positions_synced",
+        "_statistics",
+        "_extra",
+        "_player_list_index",
+        "_changed",
+    )
+
     def __init__(self):
         self._lock = threading.RLock()  # Reentrant lock to allow nested locking
+        self._pos_lock = threading.Lock()  # Player and pet positions only
+        self._stats_lock = threading.Lock()  # Statistics only
         self._player_id: Optional[str] = None
         self._player_name: Optional[str] = None
         self._room_id: Optional[str] = None
         self._full_state: Optional[Dict[str, Any]] = None
-        self._player_position: Dict[str, int] = {"x": 11, "y": 11}
+        self._player_x: int = 11
+        self._player_y: int = 11
         self._user_slot_index: Optional[int] = None
-        self._pet_positions: Dict[str, Dict[str, int]] = {}
+        self._pet_positions: Dict[str, Tuple[int, int]] = {}  # pet_id -> (x, y)
         self._pet_positions_synced: bool = False
         self._statistics = Statistics()
         self._extra: Dict[str, Any] = {}  # For runtime-added keys like room_id_override
+        self._player_list_index: Optional[int] = None  # Our last index in the players list
+        self._changed = threading.Event()  # Set whenever full_state is replaced or patched
+        self._changed.set()
 
     # Player info methods
     def get_player_id(self) -> Optional[str]:
-        with self._lock:
-            return self._player_id
+        return self._player_id
 
     def set_player_id(self, player_id: str):
         with self._lock:
             self._player_id = player_id
 
     def get_player_name(self) -> Optional[str]:
-        with self._lock:
-            return self._player_name
+        return self._player_name
 
     def set_player_name(self, name: str):
         with self._lock:
@@ -70,8 +175,7 @@ class GameState:
 
     # Room methods
     def get_room_id(self) -> Optional[str]:
-        with self._lock:
-            return self._room_id
+        return self._room_id
 
     def set_room_id(self, room_id: str):
         with self._lock:
@@ -81,12 +185,31 @@ class GameState:
     def get_full_state(self) -> Optional[Dict[str, Any]]:
         """Returns a deep copy of the full state"""
         with self._lock:
-            return deepcopy(self._full_state) if self._full_state else None
+            return _fast_clone(self._full_state) if self._full_state else None
 
     def set_full_state(self, state: Dict[str, Any]):
         """Sets the full state (makes a deep copy internally)"""
+        # orjson already shares key strings through its key cache; the stdlib
+        # fallback allocates one per occurrence, so intern them while copying
+        cloned = _fast_clone(state) if orjson is not None else _clone_interned(state)
         with self._lock:
-            self._full_state = deepcopy(state)
+            self._store_full_state(cloned)
+
+    def _store_full_state(self, state: Optional[Dict[str, Any]]):
+        """Replace full_state and flag the change (caller must hold lock)"""
+        self._full_state = state
+        self._changed.set()
+
+    def get_full_state_snapshot(self) -> Optional[Dict[str, Any]]:
+        """Returns the live full state for read-only use on the bot's event loop.
+
+        Patches are only applied on the event loop thread, so automation code
+        running there may read this without copying, provided it never mutates
+        it and doesn't hold on to it across an await. Other threads (the GUI)
+        must use get_full_state().
+        """
+        with self._lock:
+            return self._full_state
 
     def get_full_state_unsafe(self) -> Optional[Dict[str, Any]]:
         """Returns the actual full state reference (caller must hold lock or know what they're doing)"""
@@ -101,44 +224,56 @@ class GameState:
         with self._lock:
             if self._full_state:
                 updater_fn(self._full_state)
+                self._changed.set()
+
+    def consume_changed(self) -> bool:
+        """Return whether full_state changed since the last call, clearing the flag
+
+        Lets pollers such as the GUI skip re-rendering when nothing was patched.
+        """
+        if not self._changed.is_set():
+            return False
+        self._changed.clear()
+        return True
 
     # Player position methods
     def get_player_position(self) -> Dict[str, int]:
-        with self._lock:
-            return self._player_position.copy()
+        with self._pos_lock:
+            return {"x": self._player_x, "y": self._player_y}
 
     def set_player_position(self, x: int, y: int):
-        with self._lock:
-            self._player_position = {"x": x, "y": y}
+        with self._pos_lock:
+            self._player_x = x
+            self._player_y = y
 
     # User slot index methods
     def get_user_slot_index(self) -> Optional[int]:
-        with self._lock:
-            return self._user_slot_index
+        return self._user_slot_index
 
     def set_user_slot_index(self, index: int):
         with self._lock:
             self._user_slot_index = index
 
     # Pet positions methods
-    def get_pet_positions(self) -> Dict[str, Dict[str, int]]:
-        with self._lock:
-            return deepcopy(self._pet_positions)
+    def get_pet_positions(self) -> Dict[str, Tuple[int, int]]:
+        """Returns a copy of the pet positions as {pet_id: (x, y)}"""
+        with self._pos_lock:
+            # Values are immutable tuples, so a shallow copy is enough
+            return dict(self._pet_positions)
 
     def set_pet_position(self, pet_id: str, x: int, y: int):
-        with self._lock:
-            self._pet_positions[pet_id] = {"x": x, "y": y}
+        with self._pos_lock:
+            self._pet_positions[pet_id] = (x, y)
 
     def clear_pet_positions(self):
-        with self._lock:
+        with self._pos_lock:
             self._pet_positions.clear()
 
     def get_pet_positions_synced(self) -> bool:
-        with self._lock:
-            return self._pet_positions_synced
+        return self._pet_positions_synced
 
     def set_pet_positions_synced(self, synced: bool):
-        with self._lock:
+        with self._pos_lock:
             self._pet_positions_synced = synced
 
     # Statistics methods
@@ -149,11 +284,23 @@ class GameState:
             stat_name: Name of the statistic field (e.g., "messages_received")
             amount: Amount to increment by (default: 1)
         """
-        with self._lock:
-            if hasattr(self._statistics, stat_name):
-                current = getattr(self._statistics, stat_name)
-                if isinstance(current, int):
-                    setattr(self._statistics, stat_name, current + amount)
+        if stat_name not in _COUNTER_FIELDS:
+            return
+        with self._stats_lock:
+            stats = self._statistics
+            setattr(stats, stat_name, getattr(stats, stat_name) + amount)
+
+    def increment_stats(self, counts: Dict[str, int]):
+        """Atomically apply several counter increments under one lock
+
+        Args:
+            counts: Mapping of statistic field name to amount
+        """
+        with self._stats_lock:
+            stats = self._statistics
+            for stat_name, amount in counts.items():
+                if amount and stat_name in _COUNTER_FIELDS:
+                    setattr(stats, stat_name, getattr(stats, stat_name) + amount)
 
     def set_stat(self, stat_name: str, value):
         """Set a statistic value
@@ -162,58 +309,58 @@ class GameState:
             stat_name: Name of the statistic field
             value: New value to set
         """
-        with self._lock:
+        with self._stats_lock:
             if hasattr(self._statistics, stat_name):
                 setattr(self._statistics, stat_name, value)
 
     def get_statistics(self) -> Statistics:
         """Get a copy of the current statistics"""
-        with self._lock:
+        with self._stats_lock:
             # Return a copy to prevent external modification
-            return Statistics(
-                messages_received=self._statistics.messages_received,
-                messages_sent=self._statistics.messages_sent,
-                pings_sent=self._statistics.pings_sent,
-                pings_received=self._statistics.pings_received,
-                pongs_sent=self._statistics.pongs_sent,
-                pongs_received=self._statistics.pongs_received,
-                last_update=self._statistics.last_update,
-                patches_applied=self._statistics.patches_applied
-            )
+            return replace(self._statistics)
+
+    def _statistics_dict(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            return {name: getattr(self._statistics, name) for name in Statistics.__slots__}
 
     # Extra keys (for backwards compatibility with dict-like access)
+    # Built-in keys dispatch through these tables; anything else lives in _extra
+    _GETTERS = {
+        "player_id": lambda self: self._player_id,
+        "player_name": lambda self: self._player_name,
+        "room_id": lambda self: self._room_id,
+        "full_state": lambda self: (
+            _fast_clone(self._full_state) if self._full_state else None
+        ),
+        "user_slot_index": lambda self: self._user_slot_index,
+        # Return dict for backwards compatibility
+        "statistics": lambda self: self._statistics_dict(),
+    }
+
+    _SETTERS = {
+        "player_id": lambda self, value: setattr(self, "_player_id", value),
+        "player_name": lambda self, value: setattr(self, "_player_name", value),
+        "room_id": lambda self, value: setattr(self, "_room_id", value),
+        "full_state": lambda self, value: self._store_full_state(
+            _fast_clone(value) if value else None
+        ),
+        "user_slot_index": lambda self, value: setattr(self, "_user_slot_index", value),
+        # Ignore direct statistics assignment, use increment_stat/set_stat
+        "statistics": lambda self, value: None,
+    }
+
     def get(self, key: str, default=None):
         """Dict-like get for backwards compatibility"""
+        getter = GameState._GETTERS.get(key)
         with self._lock:
-            if key == "player_id":
-                return self._player_id
-            elif key == "player_name":
-                return self._player_name
-            elif key == "room_id":
-                return self._room_id
-            elif key == "full_state":
-                return deepcopy(self._full_state) if self._full_state else None
-            elif key == "user_slot_index":
-                return self._user_slot_index
-            elif key == "statistics":
-                # Return dict for backwards compatibility
-                return {
-                    "messages_received": self._statistics.messages_received,
-                    "messages_sent": self._statistics.messages_sent,
-                    "pings_sent": self._statistics.pings_sent,
-                    "pings_received": self._statistics.pings_received,
-                    "pongs_sent": self._statistics.pongs_sent,
-                    "pongs_received": self._statistics.pongs_received,
-                    "last_update": self._statistics.last_update,
-                    "patches_applied": self._statistics.patches_applied
-                }
-            else:
-                return self._extra.get(key, default)
+            if getter is not None:
+                return getter(self)
+            return self._extra.get(key, default)
 
     def __getitem__(self, key: str):
         """Dict-like access for backwards compatibility"""
         result = self.get(key)
-        if result is None and key not in ["player_id", "player_name", "room_id", "full_state", "user_slot_index"]:
+        if result is None and key not in GameState._GETTERS:
             with self._lock:
                 if key not in self._extra:
                     raise KeyError(key)
@@ -221,28 +368,18 @@ class GameState:
 
     def __setitem__(self, key: str, value):
         """Dict-like setting for backwards compatibility"""
+        setter = GameState._SETTERS.get(key)
         with self._lock:
-            if key == "player_id":
-                self._player_id = value
-            elif key == "player_name":
-                self._player_name = value
-            elif key == "room_id":
-                self._room_id = value
-            elif key == "full_state":
-                self._full_state = deepcopy(value) if value else None
-            elif key == "user_slot_index":
-                self._user_slot_index = value
-            elif key == "statistics":
-                # Ignore direct statistics assignment, use increment_stat/set_stat
-                pass
+            if setter is not None:
+                setter(self, value)
             else:
                 self._extra[key] = value
 
     def __contains__(self, key: str) -> bool:
         """Dict-like 'in' operator"""
+        if key in GameState._GETTERS:
+            return True
         with self._lock:
-            if key in ["player_id", "player_name", "room_id", "full_state", "user_slot_index", "statistics"]:
-                return True
             return key in self._extra
 
     # Helper methods for common operations
@@ -260,14 +397,16 @@ class GameState:
             # Update player name from room player list
             room_data = self._full_state.get("data") or {}
             players = room_data.get("players") or []
-            for player in players:
-                if player and player.get("id") == self._player_id:
-                    player_name = player.get("name")
-                    if player_name:
-                        self._player_name = player_name
-                    elif not self._player_name:
-                        self._player_name = self._player_id
-                    break
+            player_idx = _find_entry_index(
+                players, "id", self._player_id, self._player_list_index
+            )
+            self._player_list_index = player_idx
+            if player_idx is not None:
+                player_name = players[player_idx].get("name")
+                if player_name:
+                    self._player_name = player_name
+                elif not self._player_name:
+                    self._player_name = self._player_id
 
             # Update slot index from Quinoa child state
             child_state = self._full_state.get("child") or {}
@@ -277,13 +416,28 @@ class GameState:
             quinoa_state = child_state.get("data") or {}
             user_slots = quinoa_state.get("userSlots") or []
 
-            # Clear stale slot index before refresh to avoid using old value on reconnect
-            self._user_slot_index = None
+            # The cached index is only reused if it still points at our slot, so a
+            # stale value from a previous connection is never kept
+            self._user_slot_index = _find_entry_index(
+                user_slots, "playerId", self._player_id, self._user_slot_index
+            )
+
+    def _find_player_slot_locked(self) -> Optional[Dict[str, Any]]:
+        """Return the live reference to the player's user slot (caller must hold lock)"""
+        if not self._full_state or not self._player_id:
+            return None
+
+        child_state = self._full_state.get("child", {})
+        if child_state.get("scope") != "Quinoa":
+            return None
 
-            for idx, slot in enumerate(user_slots):
-                if slot and slot.get("playerId") == self._player_id:
-                    self._user_slot_index = idx
-                    break
+        quinoa_state = child_state.get("data", {})
+        user_slots = quinoa_state.get("userSlots", [])
+
+        idx = _find_entry_index(
+            user_slots, "playerId", self._player_id, self._user_slot_index
+        )
+        return user_slots[idx] if idx is not None else None
 
     def get_player_slot(self) -> Optional[Dict[str, Any]]:
         """Find and return the player's user slot from game state.
@@ -295,21 +449,53 @@ class GameState:
             Deep copy of the player's slot, or None if not found
         """
         with self._lock:
-            if not self._full_state or not self._player_id:
-                return None
+            slot = self._find_player_slot_locked()
+            return _fast_clone(slot) if slot else None
 
-            child_state = self._full_state.get("child", {})
-            if child_state.get("scope") != "Quinoa":
-                return None
+    def get_player_slot_snapshot(self) -> Tuple[Optional[Dict[str, Any]], Dict[str, Any]]:
+        """Return the player's slot data and petSlotInfos in a single locked pass.
 
-            quinoa_state = child_state.get("data", {})
-            user_slots = quinoa_state.get("userSlots", [])
+        Unlike get_player_slot() this does not deep copy. The slot data is the
+        live reference and must be treated as read-only; petSlotInfos is
+        shallow-copied so callers can iterate it safely.
 
-            for slot in user_slots:
-                if slot and slot.get("playerId") == self._player_id:
-                    return deepcopy(slot)
+        Returns:
+            Tuple of (slot_data, pet_slot_infos); slot_data is None if unavailable
+        """
+        with self._lock:
+            slot = self._find_player_slot_locked()
+            if not slot:
+                return None, {}
 
-            return None
+            slot_data = slot.get("data")
+            if not isinstance(slot_data, dict):
+                slot_data = None
+
+            pet_slot_infos = slot.get("petSlotInfos")
+            if not isinstance(pet_slot_infos, dict):
+                pet_slot_infos = {}
+
+            return slot_data, dict(pet_slot_infos)
+
+    def get_player_count(self) -> int:
+        """Count occupied player slots without copying the full state"""
+        with self._lock:
+            if not self._full_state:
+                return 0
+            players = self._full_state.get("data", {}).get("players", [])
+            return sum(1 for p in players if p is not None)
+
+    def get_shops(self) -> Dict[str, Any]:
+        """Get a copy of the Quinoa shops data (empty dict if unavailable)
+
+        Only the shops subtree is copied, not the whole full state.
+        """
+        with self._lock:
+            if not self._full_state:
+                return {}
+            child_state = self._full_state.get("child", {})
+            shops = child_state.get("data", {}).get("shops", {})
+            return _fast_clone(shops) if shops else {}
 
     def get_all_user_slots(self) -> list[Dict[str, Any]]:
         """Get all user slots in the current room.
@@ -332,7 +518,7 @@ class GameState:
             user_slots = quinoa_state.get("userSlots", [])
 
             # Return deep copies of all non-None slots
-            return [deepcopy(slot) for slot in user_slots if slot]
+            return [_fast_clone(slot) for slot in user_slots if slot]
 
     def get_player_name_by_id(self, player_id: str) -> Optional[str]:
         """Get the display name for a given player ID.
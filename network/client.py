@@ -6,8 +6,9 @@ message sending/receiving, and running automation tasks.
 """
 
 import asyncio
-import json
-import traceback
+import heapq
+import logging
+import time
 from datetime import datetime
 from typing import Optional, Dict, Any, Tuple, List, Callable
 
@@ -20,11 +21,69 @@ from network.protocol import (
     process_message,
     process_welcome_message,
     log_message_to_file,
+    start_message_log,
+    configure_message_log,
     is_player_in_room_state,
-    apply_json_patch,
+    index_players_by_id,
+    apply_json_patches,
     GardenFullError,
 )
-from utils.constants import MESSAGE_LOG_FILE, SPAWN_POSITIONS, GAME_VERSION
+from utils.constants import SPAWN_POSITIONS, GAME_VERSION, MAIN_ROOMS
+from utils import json_codec
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+# Headers shared by every websocket connect; only the cookie varies
+_WS_BASE_HEADERS = {
+    "Origin": "https://magicgarden.gg",
+    "User-Agent": USER_AGENT,
+}
+
+# Static parts of the authenticate request; cookie and referer vary per call
+_AUTH_BASE_HEADERS = {
+    "accept": "*/*",
+    "content-type": "application/json",
+    "origin": "https://magicgarden.gg",
+    "user-agent": USER_AGENT,
+}
+
+_ROOMS_PATH = f"magicgarden.gg/version/{GAME_VERSION}/api/rooms/"
+
+# Frames sent right after connecting, encoded once at import
+_JOIN_FRAMES = tuple(
+    json_codec.dumps({"scopePath": ["Room"], "type": msg_type, "gameName": "Quinoa"})
+    for msg_type in ("VoteForGame", "SetSelectedGame")
+)
+
+# Patch paths that can replace the players list wholesale (the list and its ancestors)
+_PLAYERS_ANCESTOR_PATHS = frozenset(("", "/data", "/data/players"))
+
+
+def _patch_touches_players(patch) -> bool:
+    """Check whether a JSON patch could change the room's players list."""
+    path = patch.get("path", "")
+    return path.startswith("/data/players") or path in _PLAYERS_ANCESTOR_PATHS
+
+
+def is_ping_frame(message: bytes) -> bool:
+    """
+    Check whether a raw frame is the server's plain-text keep-alive ping.
+
+    The exact frame is matched first; JSON frames are far longer than "ping",
+    so the length check rejects them without allocating stripped/lowercased
+    copies.
+
+    Args:
+        message: Raw frame bytes
+
+    Returns:
+        True if the frame is a ping
+    """
+    if message == b"ping":
+        return True
+    return len(message) <= 8 and message.strip().lower() == b"ping"
 
 
 class MagicGardenClient:
@@ -33,6 +92,12 @@ class MagicGardenClient:
     Handles connection, authentication, room joining, and message handling.
     """
 
+    OUTBOX_MAX_SIZE = 1000  # send() waits once this many frames are pending
+    INBOX_MAX_SIZE = 2048  # Receive loop waits once this many frames are unprocessed
+    ROOM_PROBE_CONCURRENCY = 3  # Rooms authenticated/joined at once while searching
+    WRITER_BATCH_SIZE = 32
+    WS_MAX_MESSAGE_SIZE = 2**22  # Welcome frames for busy rooms can exceed the 1 MiB default
+
     def __init__(self, game_state: GameState, config: BotConfig):
         """
         Initialize the client.
@@ -45,8 +110,14 @@ class MagicGardenClient:
         self.config = config
         self.websocket = None
         self.task_factories: List[Callable] = []  # Functions that create tasks
+        # (callback, interval, initial_delay, name) run by the shared scheduler
+        self.periodic_actions: List[Tuple[Callable, float, float, str]] = []
         self.player_id = config.player_id
         self.cookies = config.cookies
+        configure_message_log(config.message_log_enabled, config.message_log_pretty)
+        # self.cookies parsed into {name: value}; re-parsed when it changes
+        self._cookie_jar: Dict[str, str] = {}
+        self._cookie_jar_source: Optional[str] = None
         self.spawn_pos = None
 
         # Connection lifecycle management
@@ -54,6 +125,35 @@ class MagicGardenClient:
         self._disconnect_requested = asyncio.Event()
         self._connection_id = 0  # Incremented on each new connection
 
+        # Outbound frames, drained by the per-session writer task
+        self._outbox: Optional[asyncio.Queue] = None
+        # Inbound frames, filled by the receive loop and drained by the processor
+        self._inbox: Optional[asyncio.Queue] = None
+
+        # HTTP session shared by all authenticate() calls, created on first use
+        self._http_session: Optional[aiohttp.ClientSession] = None
+
+        # Websocket connect query string; only the room in the path varies
+        self._ws_query = (
+            f"/connect?surface=%22web%22&platform=%22desktop%22&playerId=%22{self.player_id}%22"
+            f"&version=%22{GAME_VERSION}%22&source=%22manualUrl%22"
+            "&capabilities=%22fbo_mipmap_unsupported%22"
+        )
+
+        # Per-frame counters, flushed to game_state once a second
+        self._stat_buffer: Dict[str, int] = {
+            "messages_sent": 0,
+            "pings_sent": 0,
+            "pings_received": 0,
+            "pongs_sent": 0,
+        }
+
+        self._ping_message = {"scopePath": ["Room", "Quinoa"], "type": "Ping", "id": 0}
+
+        # Keep-alive pings run on the shared scheduler like other periodic actions
+        self.register_periodic(self.send_ping, 2.0, name="ping")
+        self.register_periodic(self.flush_stats, 1.0, name="stats flush")
+
     @property
     def is_connected(self) -> bool:
         """Check if the client is currently connected to the server."""
@@ -67,6 +167,36 @@ class MagicGardenClient:
         print("CONNECTION LOST - Automation tasks will pause...")
         print("!" * 60 + "\n")
 
+    async def _get_http_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it if needed.
+
+        Reusing one session keeps the connection to magicgarden.gg alive
+        across rooms and retries instead of paying a TLS handshake each time.
+        """
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(ttl_dns_cache=300),
+                # Cookies are sent explicitly per request; don't let the
+                # session accumulate its own copies
+                cookie_jar=aiohttp.DummyCookieJar(),
+            )
+        return self._http_session
+
+    async def close(self):
+        """Release the shared HTTP session."""
+        if self._http_session is not None:
+            await self._http_session.close()
+            self._http_session = None
+
+    def _get_cookie_jar(self) -> Dict[str, str]:
+        """Return self.cookies as a {name: value} dict, parsing it only once."""
+        if self._cookie_jar_source != self.cookies:
+            self._cookie_jar = dict(
+                pair.partition("=")[::2] for pair in self.cookies.split("; ") if "=" in pair
+            )
+            self._cookie_jar_source = self.cookies
+        return self._cookie_jar
+
     async def authenticate(self, room_id: str) -> Tuple[Optional[Dict], Optional[str]]:
         """
         Authenticate with server for a specific room.
@@ -77,43 +207,37 @@ class MagicGardenClient:
         Returns:
             Tuple of (auth_data, updated_cookies) or (None, None) on failure
         """
-        auth_url = f"https://magicgarden.gg/version/{GAME_VERSION}/api/rooms/{room_id}/user/authenticate-web"
+        auth_url = f"https://{_ROOMS_PATH}{room_id}/user/authenticate-web"
         headers = {
-            "accept": "*/*",
-            "content-type": "application/json",
-            "origin": "https://magicgarden.gg",
+            **_AUTH_BASE_HEADERS,
             "referer": f"https://magicgarden.gg/r/{room_id}",
-            "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
             "cookie": self.cookies,
         }
         payload = {"provider": "maybe-existing-jwt"}
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(auth_url, json=payload, headers=headers) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        updated_cookies = self.cookies
-
-                        if "Set-Cookie" in response.headers:
-                            set_cookie = response.headers.get("Set-Cookie")
-                            new_cookie = set_cookie.split(";")[0]
-                            cookie_dict = {}
-                            for cookie_pair in self.cookies.split("; "):
-                                if "=" in cookie_pair:
-                                    name, value = cookie_pair.split("=", 1)
-                                    cookie_dict[name] = value
-                            if "=" in new_cookie:
-                                name, value = new_cookie.split("=", 1)
-                                cookie_dict[name] = value
-                            updated_cookies = "; ".join(
-                                [f"{k}={v}" for k, v in cookie_dict.items()]
-                            )
-
-                        if data.get("isAuthenticated"):
-                            return data, updated_cookies
-
-                    return None, None
+            session = await self._get_http_session()
+            async with session.post(auth_url, json=payload, headers=headers) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    updated_cookies = self.cookies
+
+                    if "Set-Cookie" in response.headers:
+                        set_cookie = response.headers.get("Set-Cookie")
+                        new_cookie = set_cookie.partition(";")[0]
+                        # Copy so concurrent room probes don't share edits
+                        cookie_dict = dict(self._get_cookie_jar())
+                        name, sep, value = new_cookie.partition("=")
+                        if sep:
+                            cookie_dict[name] = value
+                        updated_cookies = "; ".join(
+                            f"{k}={v}" for k, v in cookie_dict.items()
+                        )
+
+                    if data.get("isAuthenticated"):
+                        return data, updated_cookies
+
+                return None, None
         except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             print(f"  Network error during authentication: {e}")
             return None, None
@@ -131,37 +255,45 @@ class MagicGardenClient:
         Returns:
             Tuple of (websocket, welcome_data, room_id) or (None, None, None) on failure
         """
-        url = f"wss://magicgarden.gg/version/{GAME_VERSION}/api/rooms/{room_id}/connect?surface=%22web%22&platform=%22desktop%22&playerId=%22{self.player_id}%22&version=%22{GAME_VERSION}%22&source=%22manualUrl%22&capabilities=%22fbo_mipmap_unsupported%22"
+        url = f"wss://{_ROOMS_PATH}{room_id}{self._ws_query}"
 
         print(f"\nTrying room {room_id}...")
 
+        websocket = None
         try:
-            # Connect WITHOUT async with so we can keep the connection open
+            # Connect WITHOUT async with so we can keep the connection open.
+            # permessage-deflate is disabled: most traffic is small Ping/Pong/
+            # PetPositions frames where compression costs CPU for no gain.
             websocket = await websockets.connect(
-                url, additional_headers=headers, compression="deflate"
+                url,
+                additional_headers=headers,
+                compression=None,
+                max_size=self.WS_MAX_MESSAGE_SIZE,
             )
 
-            # Send initial messages
-            await self._send_message_raw(
-                websocket,
-                {"scopePath": ["Room"], "type": "VoteForGame", "gameName": "Quinoa"},
-            )
-            await self._send_message_raw(
-                websocket,
-                {"scopePath": ["Room"], "type": "SetSelectedGame", "gameName": "Quinoa"},
-            )
+            # Send initial messages (pre-encoded). send() writes straight to the
+            # transport while its buffer is below the high-water mark, so both
+            # frames go out back-to-back without yielding; sending them one
+            # after the other also guarantees the server sees them in order.
+            for frame in _JOIN_FRAMES:
+                await websocket.send(frame, text=True)
 
-            # Wait for Welcome message with timeout
+            # Wait for Welcome message with timeout. Frames are received as
+            # undecoded bytes; the JSON parser validates UTF-8 itself.
             try:
-                message = await asyncio.wait_for(websocket.recv(), timeout=5.0)
+                message = await asyncio.wait_for(
+                    websocket.recv(decode=False), timeout=5.0
+                )
 
-                if message.strip().lower() == "ping":
+                if is_ping_frame(message):
                     await websocket.send("pong")
-                    message = await asyncio.wait_for(websocket.recv(), timeout=5.0)
+                    message = await asyncio.wait_for(
+                        websocket.recv(decode=False), timeout=5.0
+                    )
 
                 try:
-                    data = json.loads(message)
-                except json.JSONDecodeError as e:
+                    data = json_codec.loads(message)
+                except json_codec.JSONDecodeError as e:
                     print(f"  Failed to parse message from {room_id}: {e}")
                     print(f"  Raw message: {message[:200]}")
                     await websocket.close()
@@ -192,20 +324,23 @@ class MagicGardenClient:
                         await websocket.close()
                         return None, None, None
 
-                    print(f"  Found {len(players)} players in room {room_id}:")
-                    for idx, player in enumerate(players):
-                        if player:
-                            player_name = player.get("name", "Unknown")
-                            player_id_in_room = player.get("id", "Unknown")
-                            print(
-                                f"    [{idx+1}] Name: {player_name} | ID: {player_id_in_room}"
-                            )
-                        else:
-                            print(f"    [{idx+1}] Empty slot")
+                    players_by_id = index_players_by_id(players)
+                    print(f"  Found {len(players_by_id)} players in room {room_id}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        for idx, player in enumerate(players):
+                            if player:
+                                logger.debug(
+                                    "    [%d] Name: %s | ID: %s",
+                                    idx + 1,
+                                    player.get("name", "Unknown"),
+                                    player.get("id", "Unknown"),
+                                )
+                            else:
+                                logger.debug("    [%d] Empty slot", idx + 1)
 
-                    print(f"\n  Looking for player ID: {self.player_id}")
+                    logger.debug("  Looking for player ID: %s", self.player_id)
 
-                    if is_player_in_room_state(full_state, self.player_id):
+                    if self.player_id in players_by_id:
                         # Check if garden (Quinoa game) is full before committing to this room
                         quinoa_state = full_state.get("child", {}).get("data", {})
                         if quinoa_state:
@@ -232,6 +367,8 @@ class MagicGardenClient:
                     )
                     loop = asyncio.get_running_loop()
                     wait_deadline = loop.time() + 3.0
+                    # A frame can only add us to the room if it mentions our ID
+                    player_id_bytes = self.player_id.encode()
 
                     while True:
                         remaining = wait_deadline - loop.time()
@@ -240,31 +377,43 @@ class MagicGardenClient:
 
                         try:
                             followup = await asyncio.wait_for(
-                                websocket.recv(), timeout=remaining
+                                websocket.recv(decode=False), timeout=remaining
                             )
                         except asyncio.TimeoutError:
                             break
 
-                        if isinstance(followup, str) and followup.strip().lower() == "ping":
+                        if is_ping_frame(followup):
                             await websocket.send("pong")
                             continue
 
+                        # Only PartialState and Welcome frames matter here; skip
+                        # parsing frames that can't be either
+                        if b"PartialState" not in followup and b"Welcome" not in followup:
+                            continue
+
                         try:
-                            follow_data = json.loads(followup)
-                        except json.JSONDecodeError:
+                            follow_data = json_codec.loads(followup)
+                        except json_codec.JSONDecodeError:
                             continue
 
                         msg_type = follow_data.get("type")
                         if msg_type == "PartialState":
                             patches = follow_data.get("patches") or []
-                            for patch in patches:
-                                try:
-                                    apply_json_patch(full_state, patch)
-                                except Exception as patch_err:
-                                    print(
-                                        f"  Error applying patch while waiting for player: {patch_err}"
-                                    )
-                            if is_player_in_room_state(full_state, self.player_id):
+                            _, patch_errors = apply_json_patches(full_state, patches)
+                            for _, patch_err in patch_errors:
+                                print(
+                                    f"  Error applying patch while waiting for player: {patch_err}"
+                                )
+                            # Membership can only change if a patch touches the players
+                            # list or replaces one of its ancestors
+                            touches_players = any(
+                                _patch_touches_players(patch) for patch in patches
+                            )
+                            if (
+                                touches_players
+                                and player_id_bytes in followup
+                                and is_player_in_room_state(full_state, self.player_id)
+                            ):
                                 print(
                                     f"  ✓ Found player in room {room_id} after server updates!"
                                 )
@@ -275,7 +424,9 @@ class MagicGardenClient:
                                 continue
                             data = follow_data
                             full_state = new_state
-                            if is_player_in_room_state(full_state, self.player_id):
+                            if player_id_bytes in followup and is_player_in_room_state(
+                                full_state, self.player_id
+                            ):
                                 print(
                                     f"  ✓ Found player in room {room_id} after updated Welcome!"
                                 )
@@ -298,9 +449,7 @@ class MagicGardenClient:
                                 return None, None, None
 
                     latest_players = full_state.get("data", {}).get("players", []) or []
-                    actual_player_count = sum(
-                        1 for slot in latest_players if slot is not None
-                    )
+                    actual_player_count = len(index_players_by_id(latest_players))
                     print(
                         f"  Player not in room {room_id} after waiting ({actual_player_count}/6 players)"
                     )
@@ -317,11 +466,107 @@ class MagicGardenClient:
                 await websocket.close()
                 return None, None, None
 
+        except asyncio.CancelledError:
+            # Another room won the race - don't leave this connection open
+            if websocket is not None:
+                await websocket.close()
+            raise
+        except (
+            websockets.exceptions.InvalidHandshake,
+            websockets.exceptions.ConnectionClosed,
+            asyncio.TimeoutError,
+            OSError,
+        ) as e:
+            # Expected network failures - no traceback needed
+            print(f"  Error connecting to {room_id}: {e!r}")
+            return None, None, None
         except Exception as e:
-            print(f"  Error connecting to {room_id}: {e}")
-            print(f"  Traceback: {traceback.format_exc()}")
+            print(f"  Error connecting to {room_id}: {e!r}")
+            logger.debug("  Traceback for %s:", room_id, exc_info=True)
             return None, None, None
 
+    async def _attempt_room(
+        self, room_id: str
+    ) -> Tuple[Optional[Any], Optional[Dict], Optional[str], Optional[str]]:
+        """
+        Authenticate for a room and try to join it.
+
+        Args:
+            room_id: Room ID to try (e.g., "MG1")
+
+        Returns:
+            Tuple of (websocket, welcome_data, room_id, cookies) or all None on failure
+        """
+        print(f"\n[Room {room_id}] Authenticating...")
+
+        # Authenticate for this specific room
+        auth_data, updated_cookies = await self.authenticate(room_id)
+
+        if not auth_data or not updated_cookies:
+            print(f"  ✗ Authentication failed for {room_id}")
+            return None, None, None, None
+
+        print(f"  ✓ Authentication successful for {room_id}")
+
+        # Set up headers with authenticated cookies
+        headers = {**_WS_BASE_HEADERS, "Cookie": updated_cookies}
+
+        # Try to connect to this room
+        ws, data, room = await self.try_room(room_id, headers)
+        if not ws or not data:
+            return None, None, None, None
+        return ws, data, room, updated_cookies
+
+    async def _probe_rooms(
+        self, rooms: List[str]
+    ) -> Optional[Tuple[Any, Dict, str, str]]:
+        """
+        Try rooms a few at a time and keep the first one that lets us in.
+
+        Attempts in a batch run concurrently; once one succeeds the rest are
+        cancelled and any extra connections that also succeeded are closed.
+
+        Args:
+            rooms: Room IDs to try, in order
+
+        Returns:
+            Tuple of (websocket, welcome_data, room_id, cookies) or None
+        """
+        remaining = list(rooms)
+        while remaining:
+            batch = remaining[: self.ROOM_PROBE_CONCURRENCY]
+            remaining = remaining[self.ROOM_PROBE_CONCURRENCY :]
+
+            tasks = [asyncio.create_task(self._attempt_room(room)) for room in batch]
+            winner = None
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    try:
+                        ws, data, room, cookies = await next_done
+                    except Exception as e:
+                        print(f"  Error trying room: {e}")
+                        continue
+                    if ws and data:
+                        winner = (ws, data, room, cookies)
+                        break
+            finally:
+                for task in tasks:
+                    if not task.done():
+                        task.cancel()
+                outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+                for outcome in outcomes:
+                    if (
+                        isinstance(outcome, tuple)
+                        and outcome[0] is not None
+                        and (winner is None or outcome[0] is not winner[0])
+                    ):
+                        await outcome[0].close()
+
+            if winner:
+                return winner
+
+        return None
+
     async def _send_message_raw(self, websocket, message: Dict[str, Any]):
         """
         Send a message to the server (internal helper that doesn't log or track stats).
@@ -330,7 +575,8 @@ class MagicGardenClient:
             websocket: WebSocket connection
             message: Message to send
         """
-        await websocket.send(json.dumps(message))
+        # text=True sends the UTF-8 bytes as a text frame without a str round-trip
+        await websocket.send(json_codec.dumps(message), text=True)
 
     async def send(self, message: Dict[str, Any]):
         """
@@ -342,22 +588,32 @@ class MagicGardenClient:
         Raises:
             RuntimeError: If not connected to server
         """
-        if not self.is_connected:
+        if not self.is_connected or self._outbox is None:
             raise RuntimeError(
                 "Not connected to server - connection has been lost. "
                 "Automation tasks should exit gracefully."
             )
 
-        await self.websocket.send(json.dumps(message))
-        self.game_state.increment_stat("messages_sent")
-        log_message_to_file("SENT", message)
+        # Serialize now so later mutations of the dict don't leak into the frame
+        frame = json_codec.dumps(message)
+        await self._outbox.put(frame)
+        self._stat_buffer["messages_sent"] += 1
+        log_message_to_file("SENT", frame)
 
     async def send_ping(self):
         """Send a ping message to the server."""
-        ping_id = int(datetime.now().timestamp() * 1000)
-        ping_message = {"scopePath": ["Room", "Quinoa"], "type": "Ping", "id": ping_id}
-        await self.send(ping_message)
-        self.game_state.increment_stat("pings_sent")
+        # send() serializes immediately, so the same dict can be reused
+        self._ping_message["id"] = time.time_ns() // 1_000_000
+        await self.send(self._ping_message)
+        self._stat_buffer["pings_sent"] += 1
+
+    async def flush_stats(self):
+        """Move buffered frame counters into the shared game state."""
+        buffer = self._stat_buffer
+        if any(buffer.values()):
+            self.game_state.increment_stats(buffer)
+            for key in buffer:
+                buffer[key] = 0
 
     def register_task(self, task_factory):
         """
@@ -368,43 +624,138 @@ class MagicGardenClient:
         """
         self.task_factories.append(task_factory)
 
+    def register_periodic(
+        self,
+        callback: Callable,
+        interval: float,
+        initial_delay: Optional[float] = None,
+        name: str = "periodic",
+    ):
+        """
+        Register an action to run every `interval` seconds while connected.
+
+        All periodic actions share one scheduler task and timer. A tick is
+        skipped if the previous run of the same action is still in progress.
+
+        Args:
+            callback: A function that returns a coroutine for one run
+            interval: Seconds between runs
+            initial_delay: Seconds before the first run (defaults to interval)
+            name: Label used in error messages
+        """
+        if initial_delay is None:
+            initial_delay = interval
+        self.periodic_actions.append((callback, interval, initial_delay, name))
+
     async def _receive_messages(self):
         """
-        Receive and process messages from the server.
-        Internal task that runs in the background.
+        Receive messages from the server and hand them to the processor task.
+        Pings are answered here directly so they never wait behind state updates.
         """
+        inbox = self._inbox
         try:
-            async for message in self.websocket:
-                if message.strip().lower() == "ping":
-                    self.game_state.increment_stat("pings_received")
+            while True:
+                # Keep frames as bytes - skips a UTF-8 decode pass per frame
+                message = await self.websocket.recv(decode=False)
+                if is_ping_frame(message):
+                    self._stat_buffer["pings_received"] += 1
                     await self.websocket.send("pong")
-                    self.game_state.increment_stat("pongs_sent")
+                    self._stat_buffer["pongs_sent"] += 1
                     log_message_to_file("SENT", "pong")
                     continue
-                process_message(message, self.game_state)
+                await inbox.put(message)
         except websockets.exceptions.ConnectionClosed:
             pass
         finally:
             # Signal disconnect when receive loop exits for any reason
             self._signal_disconnect()
 
-    async def _ping_task(self):
+    async def _process_messages(self):
         """
-        Send pings periodically.
-        Exits gracefully when connection is lost.
+        Parse and apply queued inbound frames in arrival order.
+        A processing error ends the session, as it did when frames were processed inline.
         """
-        while self.is_connected:
-            await asyncio.sleep(2)
-            if not self.is_connected:
-                break
+        inbox = self._inbox
+        while True:
+            message = await inbox.get()
             try:
-                await self.send_ping()
-            except RuntimeError:
-                # Connection lost, exit gracefully
-                break
+                process_message(message, self.game_state)
             except Exception as e:
-                print(f"Error in ping task: {e}")
-                break
+                logger.exception("Error processing message: %s", e)
+                # Closing the socket ends the receive loop, which tears down the session
+                await self.websocket.close()
+                return
+
+    async def _writer_task(self):
+        """
+        Drain the outbound queue onto the websocket.
+        Frames queued while a send is in flight are written back-to-back.
+        """
+        outbox = self._outbox
+        websocket = self.websocket
+        try:
+            while True:
+                batch = [await outbox.get()]
+                while len(batch) < self.WRITER_BATCH_SIZE and not outbox.empty():
+                    batch.append(outbox.get_nowait())
+                for frame in batch:
+                    # Frames are UTF-8 JSON bytes; send them as text frames
+                    await websocket.send(frame, text=True)
+        except websockets.exceptions.ConnectionClosed:
+            # The receive task notices the close and signals the disconnect
+            pass
+        except Exception as e:
+            logger.exception("Error in writer task: %s", e)
+            # Without a writer, send() would block once the outbox fills, so
+            # close the socket to end the receive loop and tear down the session
+            await websocket.close()
+
+    async def _run_periodic(self, callback: Callable, name: str):
+        """Run one periodic action, reporting errors without stopping the scheduler."""
+        try:
+            await callback()
+        except Exception as e:
+            # Errors from sends after the connection dropped are expected
+            if self.is_connected:
+                print(f"Error in {name} task: {e}")
+
+    async def _scheduler_task(self):
+        """
+        Run all periodic actions from a single timer.
+        Exits gracefully when connection is lost.
+        """
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        heap = [
+            (start + initial_delay, index, interval)
+            for index, (_, interval, initial_delay, _) in enumerate(self.periodic_actions)
+        ]
+        heapq.heapify(heap)
+        running: Dict[int, asyncio.Task] = {}
+
+        try:
+            while heap and self.is_connected:
+                due, index, interval = heapq.heappop(heap)
+                delay = due - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                if not self.is_connected:
+                    break
+
+                callback, _, _, name = self.periodic_actions[index]
+                previous = running.get(index)
+                if previous is None or previous.done():
+                    running[index] = asyncio.create_task(
+                        self._run_periodic(callback, name)
+                    )
+
+                # Don't try to catch up on missed ticks after a stall
+                heapq.heappush(heap, (max(due + interval, loop.time()), index, interval))
+        finally:
+            for task in running.values():
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*running.values(), return_exceptions=True)
 
     async def connect(self):
         """
@@ -414,9 +765,10 @@ class MagicGardenClient:
             True if connected successfully, False otherwise
         """
         # Initialize message log
-        with open(MESSAGE_LOG_FILE, "w", encoding="utf-8") as f:
-            f.write(f"Magic Garden Bot - Message Log\n")
-            f.write(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        start_message_log(
+            "Magic Garden Bot - Message Log\n"
+            f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+        )
 
         print("=" * 60)
         print("MAGIC GARDEN BOT - STARTING")
@@ -432,15 +784,15 @@ class MagicGardenClient:
         search_main_rooms = self.config.search_main_rooms
 
         # Determine which rooms to try
-        all_rooms = [f"MG{num}" for num in range(1, 16)] if search_main_rooms else []
+        all_rooms = list(MAIN_ROOMS) if search_main_rooms else []
 
         def prioritize_room(preferred_room, rooms):
             if not preferred_room:
                 return rooms
-            ordered = [preferred_room]
-            for room in rooms:
-                if room != preferred_room:
-                    ordered.append(room)
+            ordered = list(rooms)
+            if preferred_room in ordered:
+                ordered.remove(preferred_room)
+            ordered.insert(0, preferred_room)
             return ordered
 
         if room_id_override:
@@ -474,46 +826,27 @@ class MagicGardenClient:
                 print("Either enable search_main_rooms in config or specify a room with --room-id")
                 return False
 
-        # Try rooms
+        # Try rooms. A preferred room (override or last room) gets a solo
+        # attempt first so a faster stranger's room can't win the race.
         websocket = None
         welcome_data = None
         connected_room = None
-        base_cookies = self.cookies
-
-        for room_id in rooms_to_try:
-            print(f"\n[Room {room_id}] Authenticating...")
-
-            # Authenticate for this specific room
-            auth_data, updated_cookies = await self.authenticate(room_id)
-
-            if not auth_data or not updated_cookies:
-                print(f"  ✗ Authentication failed for {room_id}")
-                continue
-
-            print(f"  ✓ Authentication successful for {room_id}")
 
-            if updated_cookies != base_cookies:
+        result = None
+        remaining_rooms = rooms_to_try
+        if (room_id_override or last_room) and len(rooms_to_try) > 1:
+            result = await self._probe_rooms(rooms_to_try[:1])
+            remaining_rooms = rooms_to_try[1:]
+        if result is None:
+            result = await self._probe_rooms(remaining_rooms)
+
+        if result:
+            websocket, welcome_data, connected_room, updated_cookies = result
+            if updated_cookies != self.cookies:
                 save_cookies(updated_cookies)
-                base_cookies = updated_cookies
                 self.cookies = updated_cookies
-
-            # Set up headers with authenticated cookies
-            headers = {
-                "Origin": "https://magicgarden.gg",
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                "Cookie": updated_cookies,
-            }
-
-            # Try to connect to this room
-            ws, data, room = await self.try_room(room_id, headers)
-
-            if ws and data:
-                websocket = ws
-                welcome_data = data
-                connected_room = room
-                # Save this as the last successful room
-                save_last_room(room)
-                break
+            # Save this as the last successful room
+            save_last_room(connected_room)
 
         if not websocket:
             print("\n" + "!" * 60)
@@ -541,6 +874,7 @@ class MagicGardenClient:
         self._connected.set()
 
         # Process the welcome message and store spawn position
+        log_message_to_file("RECEIVED (Welcome)", welcome_data)
         self.spawn_pos = process_welcome_message(welcome_data, self.game_state)
 
         return True
@@ -594,11 +928,17 @@ class MagicGardenClient:
         # Create asyncio tasks (not just coroutines)
         tasks = []
 
+        # Fresh outbound queue per session so frames never leak across connections
+        self._outbox = asyncio.Queue(maxsize=self.OUTBOX_MAX_SIZE)
+        self._inbox = asyncio.Queue(maxsize=self.INBOX_MAX_SIZE)
+
         try:
             # Create and start all tasks
             tasks.append(asyncio.create_task(self._receive_messages()))
+            tasks.append(asyncio.create_task(self._process_messages()))
+            tasks.append(asyncio.create_task(self._writer_task()))
             tasks.append(asyncio.create_task(self._startup_task()))
-            tasks.append(asyncio.create_task(self._ping_task()))
+            tasks.append(asyncio.create_task(self._scheduler_task()))
 
             # Create fresh instances of registered automation tasks
             for factory in self.task_factories:
@@ -608,26 +948,26 @@ class MagicGardenClient:
             # The receive task is always the first one
             await tasks[0]
 
-            # Connection lost - cancel all other tasks
-            for task in tasks[1:]:
-                if not task.done():
-                    task.cancel()
-
-            # Wait for all tasks to finish cancellation
-            await asyncio.gather(*tasks[1:], return_exceptions=True)
-
             return True
 
         except Exception as e:
-            # Cancel all tasks on error
+            logger.exception("Error in session: %s", e)
+            return False
+
+        finally:
+            # Connection lost, error, or we were cancelled ourselves - tear down
+            # every session task and wait for them to finish cancelling
             for task in tasks:
                 if not task.done():
                     task.cancel()
             await asyncio.gather(*tasks, return_exceptions=True)
 
-            print(f"Error in session: {e}")
-            print(f"Traceback: {traceback.format_exc()}")
-            return False
+            # Make sure the socket is closed so nothing lingers across reconnects
+            if self.websocket is not None:
+                await self.websocket.close()
+            self._outbox = None
+            self._inbox = None
+            await self.flush_stats()
 
     async def run(self):
         """
@@ -643,9 +983,10 @@ class MagicGardenClient:
 
             await self._run_with_reconnection(retry_count, max_retries, base_delay, max_delay)
         except Exception as e:
-            print(f"\n[FATAL ERROR] Unhandled exception in run(): {e}")
-            print(f"Traceback: {traceback.format_exc()}")
+            logger.exception("\n[FATAL ERROR] Unhandled exception in run(): %s", e)
             raise
+        finally:
+            await self.close()
 
     async def _run_with_reconnection(self, retry_count, max_retries, base_delay, max_delay):
         """Internal reconnection loop."""
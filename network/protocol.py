@@ -5,13 +5,16 @@ Handles JSON Patch operations, message serialization/deserialization,
 and message processing that updates GameState.
 """
 
-import json
-from datetime import datetime
-from typing import Dict, Any, Optional
-from copy import deepcopy
+import atexit
+import queue
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 
 from game_state import GameState
 from utils.constants import MESSAGE_LOG_FILE, SPAWN_POSITIONS
+from utils import json_codec
 
 
 # ========== Custom Exceptions ==========
@@ -23,27 +26,70 @@ class GardenFullError(Exception):
 
 # ========== JSON Patch Implementation (RFC 6901) ==========
 
+@lru_cache(maxsize=4096)
 def parse_json_pointer(pointer):
-    """Parse a JSON Pointer (RFC 6901) into path components"""
+    """Parse a JSON Pointer (RFC 6901) into path components.
+
+    Patch paths repeat heavily (the same user slots, tiles and shop entries),
+    so parsed results are cached and returned as immutable tuples.
+    """
     if pointer == "":
-        return []
+        return ()
     if not pointer.startswith("/"):
         raise ValueError(f"Invalid JSON Pointer: {pointer}")
 
     # Split by / and unescape
     parts = pointer[1:].split("/")
-    return [part.replace("~1", "/").replace("~0", "~") for part in parts]
+    if "~" not in pointer:
+        return tuple(parts)
+    return tuple(part.replace("~1", "/").replace("~0", "~") for part in parts)
+
+
+@lru_cache(maxsize=4096)
+def _pointer_steps(pointer):
+    """Parse a JSON Pointer into (key, list_index) pairs.
+
+    list_index is the component pre-converted to int (None if it isn't
+    numeric), so walking the path does no int() parsing per step. The string
+    key is kept too since dicts such as tileObjects use numeric string keys.
+    """
+    return tuple(
+        (part, int(part) if part.isdecimal() else None)
+        for part in parse_json_pointer(pointer)
+    )
+
+
+def _list_index(part, index):
+    """Return the precomputed list index, raising like int(part) if there is none."""
+    return int(part) if index is None else index
+
+
+def _walk_to_parent(obj, steps, pointer, create_missing=False):
+    """Follow all but the last pointer step and return the container reached."""
+    current = obj
+    for part, index in steps[:-1]:
+        current_type = type(current)
+        if current_type is dict:
+            if create_missing and part not in current:
+                # If key doesn't exist, create empty dict for nested structure
+                current[part] = {}
+            current = current[part]
+        elif current_type is list:
+            current = current[_list_index(part, index)]
+        else:
+            raise ValueError(f"Cannot navigate to {pointer}")
+    return current
 
 
 def get_by_pointer(obj, pointer):
     """Get value at JSON Pointer path"""
-    parts = parse_json_pointer(pointer)
     current = obj
-    for part in parts:
-        if isinstance(current, dict):
+    for part, index in _pointer_steps(pointer):
+        current_type = type(current)
+        if current_type is dict:
             current = current[part]
-        elif isinstance(current, list):
-            current = current[int(part)]
+        elif current_type is list:
+            current = current[_list_index(part, index)]
         else:
             raise ValueError(f"Cannot navigate to {pointer}")
     return current
@@ -51,124 +97,314 @@ def get_by_pointer(obj, pointer):
 
 def set_by_pointer(obj, pointer, value):
     """Set value at JSON Pointer path"""
-    parts = parse_json_pointer(pointer)
-    if not parts:
+    steps = _pointer_steps(pointer)
+    if not steps:
         raise ValueError("Cannot replace root")
 
-    current = obj
-    for part in parts[:-1]:
-        if isinstance(current, dict):
-            current = current[part]
-        elif isinstance(current, list):
-            current = current[int(part)]
-        else:
-            raise ValueError(f"Cannot navigate to {pointer}")
-
-    last_part = parts[-1]
-    if isinstance(current, dict):
+    current = _walk_to_parent(obj, steps, pointer)
+    last_part, last_index = steps[-1]
+    current_type = type(current)
+    if current_type is dict:
         current[last_part] = value
-    elif isinstance(current, list):
-        current[int(last_part)] = value
+    elif current_type is list:
+        current[_list_index(last_part, last_index)] = value
     else:
         raise ValueError(f"Cannot set value at {pointer}")
 
 
 def add_by_pointer(obj, pointer, value):
     """Add value at JSON Pointer path"""
-    parts = parse_json_pointer(pointer)
-    if not parts:
+    steps = _pointer_steps(pointer)
+    if not steps:
         raise ValueError("Cannot add to root")
 
-    current = obj
-    for part in parts[:-1]:
-        if isinstance(current, dict):
-            # If key doesn't exist, create empty dict for nested structure
-            if part not in current:
-                current[part] = {}
-            current = current[part]
-        elif isinstance(current, list):
-            current = current[int(part)]
-        else:
-            raise ValueError(f"Cannot navigate to {pointer}")
-
-    last_part = parts[-1]
-    if isinstance(current, dict):
+    current = _walk_to_parent(obj, steps, pointer, create_missing=True)
+    last_part, last_index = steps[-1]
+    current_type = type(current)
+    if current_type is dict:
         current[last_part] = value
-    elif isinstance(current, list):
+    elif current_type is list:
         # For arrays, can use "-" to append or index to insert
         if last_part == "-":
             current.append(value)
         else:
-            current.insert(int(last_part), value)
+            current.insert(_list_index(last_part, last_index), value)
     else:
         raise ValueError(f"Cannot add value at {pointer}")
 
 
 def remove_by_pointer(obj, pointer):
     """Remove value at JSON Pointer path"""
-    parts = parse_json_pointer(pointer)
-    if not parts:
+    steps = _pointer_steps(pointer)
+    if not steps:
         raise ValueError("Cannot remove root")
 
-    current = obj
-    for part in parts[:-1]:
-        if isinstance(current, dict):
-            current = current[part]
-        elif isinstance(current, list):
-            current = current[int(part)]
-        else:
-            raise ValueError(f"Cannot navigate to {pointer}")
-
-    last_part = parts[-1]
-    if isinstance(current, dict):
+    current = _walk_to_parent(obj, steps, pointer)
+    last_part, last_index = steps[-1]
+    current_type = type(current)
+    if current_type is dict:
         del current[last_part]
-    elif isinstance(current, list):
-        del current[int(last_part)]
+    elif current_type is list:
+        del current[_list_index(last_part, last_index)]
     else:
         raise ValueError(f"Cannot remove value at {pointer}")
 
 
+def _patch_replace(obj, patch):
+    set_by_pointer(obj, patch["path"], patch["value"])
+
+
+def _patch_add(obj, patch):
+    add_by_pointer(obj, patch["path"], patch["value"])
+
+
+def _patch_remove(obj, patch):
+    remove_by_pointer(obj, patch["path"])
+
+
+_PATCH_OPS = {
+    "replace": _patch_replace,
+    "add": _patch_add,
+    "remove": _patch_remove,
+}
+
+
 def apply_json_patch(obj, patch):
     """Apply a single JSON Patch operation to obj"""
     op = patch["op"]
-    path = patch["path"]
-
-    if op == "replace":
-        set_by_pointer(obj, path, patch["value"])
-    elif op == "add":
-        add_by_pointer(obj, path, patch["value"])
-    elif op == "remove":
-        remove_by_pointer(obj, path)
-    else:
+    handler = _PATCH_OPS.get(op)
+    if handler is None:
         raise ValueError(f"Unsupported operation: {op}")
+    handler(obj, patch)
+
+
+def apply_json_patches(obj, patches) -> Tuple[int, List[Tuple[Dict[str, Any], Exception]]]:
+    """Apply a list of JSON Patch operations to obj in order
+
+    A failing operation is skipped and the rest still apply, matching the
+    per-patch behavior of applying them one at a time.
+
+    Returns:
+        Tuple of (number applied, [(patch, error), ...] for failed patches)
+    """
+    ops = _PATCH_OPS
+    applied = 0
+    errors = []
+    for patch in patches:
+        try:
+            handler = ops.get(patch["op"])
+            if handler is None:
+                raise ValueError(f"Unsupported operation: {patch['op']}")
+            handler(obj, patch)
+            applied += 1
+        except Exception as e:
+            errors.append((patch, e))
+    return applied, errors
+
+
+# ========== Timestamps ==========
+
+# (epoch second, "%Y-%m-%d %H:%M:%S", "%H:%M:%S") for the current second, so
+# per-message timestamps only pay for strftime once a second. Replaced as one
+# tuple so readers on other threads never see a half-updated cache.
+_clock_cache = (None, "", "")
+
+
+def _clock():
+    """Return (date_time_str, time_str, milliseconds) for the current time"""
+    global _clock_cache
+
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    cache = _clock_cache
+    if cache[0] != sec:
+        local = time.localtime(sec)
+        cache = (
+            sec,
+            time.strftime("%Y-%m-%d %H:%M:%S", local),
+            time.strftime("%H:%M:%S", local),
+        )
+        _clock_cache = cache
+    return cache[1], cache[2], ns // 1_000_000
 
 
 # ========== Message Logging ==========
 
+# Log entries are queued by the caller and written by a background thread so
+# file I/O and pretty-printing never run on the event loop.
+_LOG_QUEUE_MAX = 10000
+_LOG_BATCH_SIZE = 1000
+_LOG_FLUSH_INTERVAL = 0.1  # seconds
+
+_log_queue = queue.Queue(maxsize=_LOG_QUEUE_MAX)
+_log_writer_thread: Optional[threading.Thread] = None
+_log_state_lock = threading.Lock()
+_log_dropped = 0
+# Set from the config via configure_message_log()
+_log_enabled = True
+_log_pretty = False  # Re-indent JSON bodies instead of writing frames as received
+
+# The log file stays open between batches; _log_file_lock serializes the
+# writer thread with the atexit flush
+_log_file = None
+_log_file_lock = threading.Lock()
+
+# Queued in place of a direction to truncate the log and start it over
+_LOG_RESET = object()
+
+_LOG_RULE = b"=" * 80
+
+
+def _format_log_entry(direction: str, message, timestamp: str) -> bytes:
+    """Format a single log entry as UTF-8 bytes (runs on the writer thread)"""
+    if isinstance(message, str):
+        message = message.encode("utf-8", errors="replace")
+    body = message
+    if _log_pretty:
+        try:
+            body = json_codec.dumps(json_codec.loads(message), pretty=True)
+        except json_codec.JSONDecodeError:
+            # Not JSON - log as plain text
+            pass
+    header = f"[{timestamp}] {direction}".encode()
+    return b"\n%s\n%s\n%s\n%s\n" % (_LOG_RULE, header, _LOG_RULE, body)
+
+
+def _write_log_batch(batch):
+    """Append a batch of queued entries to the message log"""
+    global _log_dropped, _log_file
+
+    with _log_state_lock:
+        dropped, _log_dropped = _log_dropped, 0
+
+    # Entries before the last reset would be truncated away, so skip them
+    reset_header = None
+    for index in range(len(batch) - 1, -1, -1):
+        if batch[index][0] is _LOG_RESET:
+            reset_header = batch[index][1]
+            batch = batch[index + 1:]
+            break
+
+    chunks = [_format_log_entry(*entry) for entry in batch]
+    if dropped:
+        chunks.append(f"\n[{dropped} log entries dropped - log queue full]\n".encode())
+
+    with _log_file_lock:
+        try:
+            if reset_header is not None:
+                if _log_file is not None:
+                    _log_file.close()
+                _log_file = open(MESSAGE_LOG_FILE, "wb")
+                chunks.insert(0, reset_header.encode())
+            elif _log_file is None:
+                _log_file = open(MESSAGE_LOG_FILE, "ab")
+            _log_file.write(b"".join(chunks))
+            _log_file.flush()
+        except Exception as e:
+            print(f"Warning: Failed to log message to file: {e}")
+            if _log_file is not None:
+                try:
+                    _log_file.close()
+                except Exception:
+                    pass
+                _log_file = None
+
+
+def _log_writer_loop():
+    """Drain the log queue, writing in batches every flush interval"""
+    while True:
+        batch = [_log_queue.get()]
+        deadline = time.monotonic() + _LOG_FLUSH_INTERVAL
+        while len(batch) < _LOG_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_log_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        _write_log_batch(batch)
+
+
+def _ensure_log_writer():
+    """Start the background log writer thread on first use"""
+    global _log_writer_thread
+
+    if _log_writer_thread is not None:
+        return
+    with _log_state_lock:
+        if _log_writer_thread is None:
+            _log_writer_thread = threading.Thread(
+                target=_log_writer_loop, name="message-log-writer", daemon=True
+            )
+            _log_writer_thread.start()
+
+
+def flush_message_log():
+    """Synchronously write any entries still waiting in the log queue"""
+    batch = []
+    while True:
+        try:
+            batch.append(_log_queue.get_nowait())
+        except queue.Empty:
+            break
+    if batch:
+        _write_log_batch(batch)
+
+
+atexit.register(flush_message_log)
+
+
+def configure_message_log(enabled: bool, pretty: bool = False):
+    """Configure message logging
+
+    Args:
+        enabled: When False, logging calls return immediately
+        pretty: Re-indent JSON bodies; otherwise frames are written compact,
+            exactly as sent/received, with no parsing on the writer thread
+    """
+    global _log_enabled, _log_pretty
+    _log_enabled = enabled
+    _log_pretty = pretty
+
+
+def start_message_log(header: str):
+    """Queue truncating the message log and writing a fresh header
+
+    Goes through the log queue so it stays ordered with queued entries and
+    the file I/O happens on the writer thread.
+    """
+    if not _log_enabled:
+        return
+    _ensure_log_writer()
+    # Block rather than drop: losing a reset would keep appending to the old log
+    _log_queue.put((_LOG_RESET, header, None))
+
+
 def log_message_to_file(direction: str, message, timestamp=None):
-    """Log all messages to file"""
+    """Queue a message to be logged to file
+
+    Raw frames (str or bytes) are queued as-is. Other messages are serialized
+    immediately (compact) so the writer thread never touches objects the
+    caller may mutate later.
+    """
+    global _log_dropped
+
+    if not _log_enabled:
+        return
+
     if timestamp is None:
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+        date_time, _, millis = _clock()
+        timestamp = f"{date_time}.{millis:03d}"
+
+    if not isinstance(message, (str, bytes)):
+        message = json_codec.dumps(message)
 
+    _ensure_log_writer()
     try:
-        with open(MESSAGE_LOG_FILE, "a", encoding="utf-8") as f:
-            f.write(f"\n{'='*80}\n")
-            f.write(f"[{timestamp}] {direction}\n")
-            f.write(f"{'='*80}\n")
-            if isinstance(message, str):
-                # Try to parse as JSON, but if it fails, log as raw text
-                try:
-                    parsed = json.loads(message)
-                    f.write(json.dumps(parsed, indent=2))
-                except json.JSONDecodeError:
-                    # Not JSON - log as plain text
-                    f.write(message)
-            else:
-                f.write(json.dumps(message, indent=2))
-            f.write("\n")
-    except Exception as e:
-        # Only suppress file I/O errors, not JSON parsing errors
-        print(f"Warning: Failed to log message to file: {e}")
+        _log_queue.put_nowait((direction, message, timestamp))
+    except queue.Full:
+        with _log_state_lock:
+            _log_dropped += 1
 
 
 # ========== Message Processing ==========
@@ -183,8 +419,6 @@ def process_welcome_message(data: Dict[str, Any], game_state: GameState) -> Opti
     Returns:
         Server spawn position dict or None
     """
-    log_message_to_file("RECEIVED (Welcome)", data)
-
     print("\n" + "=" * 60)
     print("PROCESSING WELCOME MESSAGE")
     print("=" * 60)
@@ -278,7 +512,7 @@ def process_welcome_message(data: Dict[str, Any], game_state: GameState) -> Opti
     print(f"Player: {game_state.get_player_name() or game_state.get_player_id()}")
     print("=" * 60 + "\n")
 
-    game_state.set_stat("last_update", datetime.now().strftime("%H:%M:%S"))
+    game_state.set_stat("last_update", _clock()[1])
 
     # Return the server spawn position
     return server_spawn_pos
@@ -291,9 +525,7 @@ def process_partial_state_message(data: Dict[str, Any], game_state: GameState):
         data: PartialState message data
         game_state: Game state to update
     """
-    log_message_to_file("RECEIVED (PartialState)", data)
-
-    # Check if we have full state (use unsafe accessor to avoid expensive deepcopy)
+    # Check if we have full state (unsafe accessor: only existence matters, no copy needed)
     if not game_state.get_full_state_unsafe():
         print("WARNING: Received PartialState before Welcome message")
         return
@@ -304,21 +536,31 @@ def process_partial_state_message(data: Dict[str, Any], game_state: GameState):
 
     patches = data["patches"]
 
-    # Apply each patch to the fullState
-    for patch in patches:
-        try:
-            def apply_patch(fs):
-                apply_json_patch(fs, patch)
-            game_state.update_full_state_locked(apply_patch)
-            game_state.increment_stat("patches_applied")
-        except Exception as e:
+    # Apply all patches to the fullState under a single lock acquisition
+    result = []
+
+    def apply_patches(fs):
+        result.append(apply_json_patches(fs, patches))
+
+    game_state.update_full_state_locked(apply_patches)
+    if result:
+        applied, errors = result[0]
+        game_state.increment_stat("patches_applied", applied)
+        for patch, e in errors:
             print(f"ERROR applying patch: {e}")
             print(f"Patch: {patch}")
 
-    game_state.set_stat("last_update", datetime.now().strftime("%H:%M:%S"))
+    game_state.set_stat("last_update", _clock()[1])
     game_state.refresh_player_metadata()
 
 
+def index_players_by_id(players) -> Dict[str, Dict[str, Any]]:
+    """Map player ID to player entry for the occupied slots of a players list."""
+    return {
+        player["id"]: player for player in players if player and player.get("id")
+    }
+
+
 def is_player_in_room_state(full_state: Dict[str, Any], player_id: str) -> bool:
     """Return True if the provided full_state shows the player in the room."""
     if not full_state or not player_id:
@@ -333,11 +575,30 @@ def is_player_in_room_state(full_state: Dict[str, Any], player_id: str) -> bool:
     return False
 
 
+def _process_ping_message(data: Dict[str, Any], game_state: GameState):
+    """Count an application-level Ping from the server."""
+    game_state.increment_stat("pings_received")
+
+
+def _process_pong_message(data: Dict[str, Any], game_state: GameState):
+    """Count an application-level Pong from the server."""
+    game_state.increment_stat("pongs_received")
+
+
+# Message type -> handler(data, game_state), built once at import
+_MESSAGE_HANDLERS = {
+    "Welcome": process_welcome_message,
+    "PartialState": process_partial_state_message,
+    "Ping": _process_ping_message,
+    "Pong": _process_pong_message,
+}
+
+
 def process_message(message: str, game_state: GameState) -> Optional[Dict[str, Any]]:
     """Process incoming websocket message.
 
     Args:
-        message: Raw message string
+        message: Raw message frame (str or undecoded bytes)
         game_state: Game state to update
 
     Returns:
@@ -345,23 +606,18 @@ def process_message(message: str, game_state: GameState) -> Optional[Dict[str, A
     """
     try:
         game_state.increment_stat("messages_received")
-        data = json.loads(message)
+        data = json_codec.loads(message)
         msg_type = data.get("type")
 
-        if msg_type == "Welcome":
-            process_welcome_message(data, game_state)
-        elif msg_type == "PartialState":
-            process_partial_state_message(data, game_state)
-        elif msg_type == "Ping":
-            game_state.increment_stat("pings_received")
-            log_message_to_file(f"RECEIVED ({msg_type})", data)
-        elif msg_type == "Pong":
-            game_state.increment_stat("pongs_received")
-            log_message_to_file(f"RECEIVED ({msg_type})", data)
-        else:
-            log_message_to_file(f"RECEIVED ({msg_type})", data)
+        # Log the raw frame: it's immutable, so nothing needs re-serializing
+        # here, and the log writer thread pretty-prints it
+        log_message_to_file(f"RECEIVED ({msg_type})", message)
+
+        handler = _MESSAGE_HANDLERS.get(msg_type)
+        if handler:
+            handler(data, game_state)
 
         return data
-    except json.JSONDecodeError:
+    except json_codec.JSONDecodeError:
         log_message_to_file("RECEIVED (RAW)", message)
         return None
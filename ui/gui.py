@@ -6,35 +6,64 @@ This module contains the main GUI window and console redirection.
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext
-import queue
+from collections import deque
+import threading
 import time
 
 from game_state import GameState
 from config import HarvestConfig
 from utils.coordinates import convert_server_to_local_coords
 
+_MISSING = object()  # Cache-miss sentinel, since None marks a non-numeric tile id
+
 
 # Console output redirector for GUI
 class ConsoleRedirector:
     def __init__(self, message_queue, original_stream):
-        self.message_queue = message_queue
+        self.message_queue = message_queue  # deque drained by the GUI thread
         self.original_stream = original_stream
+        self._buffer = []
+        self._lock = threading.Lock()
 
     def write(self, message):
-        # Write to original console
+        # Write to original console (flushed only on flush())
         self.original_stream.write(message)
-        self.original_stream.flush()
 
-        # Queue message for GUI thread to process
-        if self.message_queue:
-            self.message_queue.put(message)
+        if self.message_queue is None:
+            return
+
+        # Buffer fragments and queue whole lines for the GUI thread
+        with self._lock:
+            self._buffer.append(message)
+            if message.endswith("\n"):
+                self._push_buffer()
 
     def flush(self):
         self.original_stream.flush()
 
+        if self.message_queue is not None:
+            with self._lock:
+                self._push_buffer()
+
+    def _push_buffer(self):
+        """Queue buffered output as one chunk. Caller must hold _lock."""
+        if self._buffer:
+            self.message_queue.append("".join(self._buffer))
+            self._buffer.clear()
+
 
 # GUI Application - Simple Inventory Display
 class MagicGardenGUI:
+    # Console log is trimmed by CONSOLE_TRIM_LINES once it exceeds CONSOLE_MAX_LINES
+    CONSOLE_MAX_LINES = 5000
+    CONSOLE_TRIM_LINES = 1000
+
+    # GameState is polled for changes this often; patches arriving between polls
+    # are coalesced into one render
+    UPDATE_POLL_MS = 250
+    # Re-render at least this often anyway so time-based tile colors advance
+    UPDATE_MAX_IDLE_S = 1.0
+
     def __init__(self, root, game_state: GameState, harvest_config: HarvestConfig = None):
         self.root = root
         self.game_state = game_state
@@ -108,6 +137,7 @@ class MagicGardenGUI:
 
         self.setup_ui()
         self.update_ui()
+        self.schedule_update()
 
     def setup_ui(self):
         # Main container
@@ -220,6 +250,33 @@ class MagicGardenGUI:
         )
         self.garden_canvas.pack()
 
+        # Garden grid geometry is fixed, so pixel positions and the boardwalk
+        # mask are computed once: 10x20 garden plus borders and center path
+        visual_rows, visual_cols = 12, 23
+        border_offset = 2
+        self._tile_size = min(650 // visual_cols, 400 // visual_rows)
+        self._tile_xs = [border_offset + col * self._tile_size for col in range(visual_cols)]
+        self._tile_ys = [border_offset + row * self._tile_size for row in range(visual_rows)]
+        self._boardwalk = [
+            [row in (0, visual_rows - 1) or col in (0, visual_cols - 1, 11)
+             for col in range(visual_cols)]
+            for row in range(visual_rows)
+        ]
+        # (row, col, x, y) for every plantable (non-boardwalk) tile
+        self._garden_cells = [
+            (row, col, self._tile_xs[col], self._tile_ys[row])
+            for row in range(visual_rows)
+            for col in range(visual_cols)
+            if not self._boardwalk[row][col]
+        ]
+
+        # Tile id string -> (visual_row, visual_col), per garden width
+        self._tile_position_cache = {}
+
+        # Persistent garden canvas items, created on first paint and then
+        # reconfigured in place only for tiles whose look changed
+        self._reset_garden_items()
+
         # Create a canvas for the legend - INSIDE garden_frame
         self.legend_canvas = tk.Canvas(
             garden_frame,
@@ -248,8 +305,8 @@ class MagicGardenGUI:
         )
         self.console_log.pack(fill=tk.BOTH, expand=True)
 
-        # Redirect stdout to console log using a thread-safe queue
-        self.console_queue = queue.Queue()
+        # Redirect stdout to console log; deque appends/pops are thread-safe
+        self.console_queue = deque()
         import sys
         sys.stdout = ConsoleRedirector(self.console_queue, sys.stdout)
         self.root.after(50, self.process_console_queue)
@@ -314,6 +371,9 @@ class MagicGardenGUI:
         )
         self.game_stats_text.pack(fill=tk.BOTH, expand=True)
 
+        # Last text written to each text widget, used to skip no-op rewrites
+        self._widget_text = {}
+
     def draw_legend(self):
         """Draw the color legend with actual matching colors"""
         self.legend_canvas.delete("all")
@@ -355,11 +415,10 @@ class MagicGardenGUI:
         """Extract player data from full_state"""
         return self.game_state.get_player_slot()
 
-    def _calculate_garden_stats(self, tile_objects):
+    def _calculate_garden_stats(self, tile_objects, now_ms):
         """Calculate garden statistics from tile objects."""
         growing_count = 0
         mature_count = 0
-        current_time = int(time.time() * 1000)
 
         for tile_obj in tile_objects.values():
             if tile_obj and tile_obj.get("objectType") == "plant":
@@ -371,7 +430,7 @@ class MagicGardenGUI:
                 for slot in slots:
                     if slot:
                         end_time = slot.get("endTime", 0)
-                        if current_time >= end_time:
+                        if now_ms >= end_time:
                             has_mature = True
                         else:
                             has_growing = True
@@ -387,25 +446,32 @@ class MagicGardenGUI:
 
     def _build_tile_position_map(self, tile_objects, garden_cols=20):
         """Build a map from visual position to tile object for fast lookup."""
+        # Tile ids come from a small fixed set, so each is parsed only once
+        cache = self._tile_position_cache.setdefault(garden_cols, {})
         position_map = {}
 
         for tid, obj in tile_objects.items():
-            if tid.isdigit():
-                tile_id = int(tid)
-                row = tile_id // garden_cols
-                col = tile_id % garden_cols
-
-                # Convert to visual position
-                visual_row = row + 1  # +1 for top border
-                visual_col = col + 1 if col < 10 else col + 2  # +1 or +2 for borders
-
-                position_map[(visual_row, visual_col)] = (tid, obj)
+            position = cache.get(tid, _MISSING)
+            if position is _MISSING:
+                position = None
+                if tid.isdigit():
+                    tile_id = int(tid)
+                    row = tile_id // garden_cols
+                    col = tile_id % garden_cols
+
+                    # Convert to visual position
+                    visual_row = row + 1  # +1 for top border
+                    visual_col = col + 1 if col < 10 else col + 2  # +1 or +2 for borders
+                    position = (visual_row, visual_col)
+                cache[tid] = position
+
+            if position is not None:
+                position_map[position] = (tid, obj)
 
         return position_map
 
-    def _get_tile_color(self, tile_obj, min_mutations):
+    def _get_tile_color(self, tile_obj, min_mutations, now_ms):
         """Determine fill and outline color for a tile object."""
-        current_time = int(time.time() * 1000)
         obj_type = tile_obj.get("objectType")
 
         if obj_type == "plant":
@@ -432,7 +498,7 @@ class MagicGardenGUI:
                     mutations = best_slot.get("mutations", [])
                     mutation_count = len(mutations)
 
-                    if current_time >= end_time:
+                    if now_ms >= end_time:
                         # Mature
                         if mutation_count >= min_mutations:
                             return "#00e676", "#1fec84"  # Ready to harvest - vibrant green
@@ -446,7 +512,7 @@ class MagicGardenGUI:
                 return "#5a5a6e", "#6a6a7e"  # Empty plant slot
         elif obj_type == "egg":
             matured_at = tile_obj.get("maturedAt", 0)
-            if current_time >= matured_at:
+            if now_ms >= matured_at:
                 return "#69f0ae", "#7ff5bb"  # Mature egg - mint green
             else:
                 return "#ffeb3b", "#fff176"  # Growing egg - bright yellow
@@ -457,7 +523,7 @@ class MagicGardenGUI:
         else:
             return "#666666", "#888888"  # Unknown
 
-    def _draw_mutation_indicators(self, canvas, x, y, tile_size, mutations):
+    def _draw_mutation_indicators(self, canvas, x, y, tile_size, mutations, tags=None):
         """Draw mutation indicators on a plant tile."""
         indicator_size = max(tile_size // 4, 3)
 
@@ -476,6 +542,7 @@ class MagicGardenGUI:
                     indicator_y + (i + 1) * stripe_height,
                     fill=color,
                     outline="",
+                    tags=tags,
                 )
 
         # Gold indicator (top-left if Rainbow, else top-right)
@@ -490,6 +557,7 @@ class MagicGardenGUI:
                 fill="#ffd700",
                 outline="#ffed4e",
                 width=1,
+                tags=tags,
             )
 
         # Water state indicator (left side)
@@ -510,6 +578,7 @@ class MagicGardenGUI:
                     fill=color,
                     outline="#FFFFFF",
                     width=1,
+                    tags=tags,
                 )
                 break
 
@@ -530,94 +599,135 @@ class MagicGardenGUI:
                     fill=color,
                     outline="#FFFFFF",
                     width=1,
+                    tags=tags,
                 )
                 break
 
-    def _draw_pets(self, canvas, player_slot, border_offset, tile_size):
-        """Draw pet markers on the canvas."""
-        pet_slot_infos = player_slot.get("petSlotInfos")
-        if not isinstance(pet_slot_infos, dict):
-            return
+    def _reset_garden_items(self):
+        """Forget the persistent garden canvas items so the next paint recreates them."""
+        self._tile_items = [[None] * 23 for _ in range(12)]
+        self._tile_state = {}
+        self._player_marker = None
+        self._pet_markers = []
+
+    def _create_garden_items(self, canvas):
+        """Create the background, tile rectangles and marker ovals once."""
+        canvas.delete("all")
+        self._tile_state = {}
+        canvas.create_rectangle(
+            0, 0, 650, 400, fill=self.colors["canvas_bg"], outline=""
+        )
 
-        for slot_info in pet_slot_infos.values():
-            if not isinstance(slot_info, dict):
-                continue
+        tile_size = self._tile_size
+        for row, y in enumerate(self._tile_ys):
+            for col, x in enumerate(self._tile_xs):
+                # Boardwalk tiles never change, so they get their final colors here
+                if self._boardwalk[row][col]:
+                    fill_color, outline_color = "#a0826d", "#b8956f"
+                else:
+                    fill_color, outline_color = "#4a4a5e", "#5a5a6e"  # Empty
+                    self._tile_state[(row, col)] = (fill_color, outline_color, ())
 
-            position = slot_info.get("position")
-            if not isinstance(position, dict):
-                continue
+                self._tile_items[row][col] = canvas.create_rectangle(
+                    x, y, x + tile_size - 1, y + tile_size - 1,
+                    fill=fill_color, outline=outline_color, width=1
+                )
 
-            local_coords = convert_server_to_local_coords(
-                position.get("x"), position.get("y"), self.game_state
-            )
-            if not local_coords:
-                continue
+        self._pet_markers = []
+        self._player_marker = canvas.create_oval(
+            0, 0, 0, 0, fill="#00d4ff", outline="#33ddff", width=2,
+            state="hidden", tags="marker"
+        )
 
-            local_x, local_y = local_coords.get("x"), local_coords.get("y")
-            if local_x < 0 or local_x > 22 or local_y < 0 or local_y > 11:
-                continue
+    def _place_marker(self, canvas, item, local_x, local_y, border_offset, tile_size):
+        """Move a persistent marker oval onto a local tile and show it."""
+        center_x = border_offset + local_x * tile_size + tile_size // 2
+        center_y = border_offset + local_y * tile_size + tile_size // 2
+        radius = max(tile_size // 3, 4)
 
-            center_x = border_offset + local_x * tile_size + tile_size // 2
-            center_y = border_offset + local_y * tile_size + tile_size // 2
-            radius = max(tile_size // 3, 4)
+        canvas.coords(
+            item,
+            center_x - radius, center_y - radius,
+            center_x + radius, center_y + radius,
+        )
+        canvas.itemconfigure(item, state="normal")
 
-            canvas.create_oval(
-                center_x - radius, center_y - radius,
-                center_x + radius, center_y + radius,
-                fill="#d946ef", outline="#e980f5", width=2
-            )
+    def _draw_pets(self, canvas, player_slot, border_offset, tile_size):
+        """Move pet markers on the canvas, reusing one oval per pet."""
+        shown = 0
+        pet_slot_infos = player_slot.get("petSlotInfos")
+        if isinstance(pet_slot_infos, dict):
+            for slot_info in pet_slot_infos.values():
+                if not isinstance(slot_info, dict):
+                    continue
 
-    def _draw_player(self, canvas, player_slot, border_offset, tile_size):
-        """Draw player marker on the canvas."""
-        player_pos = player_slot.get("position")
-        if not isinstance(player_pos, dict):
-            return
+                position = slot_info.get("position")
+                if not isinstance(position, dict):
+                    continue
 
-        server_x, server_y = player_pos.get("x"), player_pos.get("y")
-        if server_x is None or server_y is None:
-            return
+                local_coords = convert_server_to_local_coords(
+                    position.get("x"), position.get("y"), self.game_state
+                )
+                if not local_coords:
+                    continue
+
+                local_x, local_y = local_coords.get("x"), local_coords.get("y")
+                if local_x < 0 or local_x > 22 or local_y < 0 or local_y > 11:
+                    continue
+
+                if shown == len(self._pet_markers):
+                    self._pet_markers.append(canvas.create_oval(
+                        0, 0, 0, 0, fill="#d946ef", outline="#e980f5", width=2,
+                        state="hidden", tags="marker"
+                    ))
+                self._place_marker(
+                    canvas, self._pet_markers[shown], local_x, local_y, border_offset, tile_size
+                )
+                shown += 1
 
-        local_coords = convert_server_to_local_coords(server_x, server_y, self.game_state)
-        if not local_coords:
-            return
+        # Hide markers left over from pets that are gone or off-screen
+        for item in self._pet_markers[shown:]:
+            canvas.itemconfigure(item, state="hidden")
+
+    def _draw_player(self, canvas, player_slot, border_offset, tile_size):
+        """Move the player marker on the canvas."""
+        player_x = player_y = -1
+        player_pos = player_slot.get("position")
+        if isinstance(player_pos, dict):
+            server_x, server_y = player_pos.get("x"), player_pos.get("y")
+            if server_x is not None and server_y is not None:
+                local_coords = convert_server_to_local_coords(server_x, server_y, self.game_state)
+                if local_coords:
+                    player_x, player_y = local_coords.get("x", -1), local_coords.get("y", -1)
 
-        player_x, player_y = local_coords.get("x", -1), local_coords.get("y", -1)
         if player_x < 0 or player_y < 0:
+            canvas.itemconfigure(self._player_marker, state="hidden")
             return
 
-        center_x = border_offset + player_x * tile_size + tile_size // 2
-        center_y = border_offset + player_y * tile_size + tile_size // 2
-        radius = max(tile_size // 3, 4)
-
-        canvas.create_oval(
-            center_x - radius, center_y - radius,
-            center_x + radius, center_y + radius,
-            fill="#00d4ff", outline="#33ddff", width=2
+        self._place_marker(
+            canvas, self._player_marker, player_x, player_y, border_offset, tile_size
         )
 
     def render_garden_state(self, player_slot):
-        """Render the garden grid with actual tile objects."""
+        """Render the garden grid with actual tile objects.
+
+        Tile rectangles persist between calls; only tiles whose colors or
+        mutations changed since the last render are reconfigured.
+        """
         slot_data = player_slot.get("data", {})
-        self.garden_canvas.delete("all")
+        canvas = self.garden_canvas
 
         # Extract garden data
         garden_data = slot_data.get("garden", {})
         tile_objects = garden_data.get("tileObjects", {})
 
         # Configuration
-        canvas_width = 650
-        canvas_height = 400
-        garden_rows, garden_cols = 10, 20
-        visual_rows, visual_cols = 12, 23  # +borders and paths
+        garden_cols = 20
         border_offset = 2
+        tile_size = self._tile_size
 
-        # Calculate tile size
-        tile_size = min(canvas_width // visual_cols, canvas_height // visual_rows)
-
-        # Draw background
-        self.garden_canvas.create_rectangle(
-            0, 0, canvas_width, canvas_height, fill=self.colors["canvas_bg"], outline=""
-        )
+        if self._tile_items[0][0] is None:
+            self._create_garden_items(canvas)
 
         # Build tile position map (eliminates O(n²×m) lookups)
         position_map = self._build_tile_position_map(tile_objects, garden_cols)
@@ -625,65 +735,60 @@ class MagicGardenGUI:
         # Get min mutations config
         min_mutations = self.harvest_config.min_mutations if self.harvest_config else 3
 
-        # Draw grid
-        for row in range(visual_rows):
-            for col in range(visual_cols):
-                x = border_offset + col * tile_size
-                y = border_offset + row * tile_size
-
-                # Check if boardwalk
-                is_boardwalk = row in (0, visual_rows - 1) or col in (0, visual_cols - 1, 11)
+        # One clock read per render, shared by every tile
+        now_ms = time.time_ns() // 1_000_000
+        get_tile_color = self._get_tile_color
+        tile_state = self._tile_state
+        changed = False
+
+        # Diff garden tiles (boardwalk tiles are static)
+        for row, col, x, y in self._garden_cells:
+            # Check for tile object at this position
+            tile_info = position_map.get((row, col))
+            max_mutations = ()
+            if tile_info:
+                _, tile_obj = tile_info
+                fill_color, outline_color = get_tile_color(tile_obj, min_mutations, now_ms)
+
+                if tile_obj.get("objectType") == "plant":
+                    # For multi-slot plants, show the highest mutation count
+                    for slot in tile_obj.get("slots", []):
+                        if slot:
+                            mutations = slot.get("mutations", [])
+                            if len(mutations) > len(max_mutations):
+                                max_mutations = mutations
+                    max_mutations = tuple(max_mutations)
+            else:
+                fill_color, outline_color = "#4a4a5e", "#5a5a6e"  # Empty
 
-                if is_boardwalk:
-                    fill_color, outline_color = "#a0826d", "#b8956f"
-                else:
-                    # Check for tile object at this position
-                    tile_info = position_map.get((row, col))
-                    if tile_info:
-                        tid, tile_obj = tile_info
-                        fill_color, outline_color = self._get_tile_color(tile_obj, min_mutations)
+            state = (fill_color, outline_color, max_mutations)
+            if tile_state.get((row, col)) == state:
+                continue
+            tile_state[(row, col)] = state
+            changed = True
 
-                        # Multiple slots (bushes) are now handled properly in color calculation
-                    else:
-                        fill_color, outline_color = "#4a4a5e", "#5a5a6e"  # Empty
+            canvas.itemconfigure(
+                self._tile_items[row][col], fill=fill_color, outline=outline_color
+            )
 
-                # Draw tile
-                self.garden_canvas.create_rectangle(
-                    x, y, x + tile_size - 1, y + tile_size - 1,
-                    fill=fill_color, outline=outline_color, width=1
+            # Redraw mutation indicators for this tile only
+            tag = f"mut_{row}_{col}"
+            canvas.delete(tag)
+            if max_mutations:
+                self._draw_mutation_indicators(
+                    canvas, x, y, tile_size, max_mutations, tags=tag
                 )
 
-                # Draw mutation indicators
-                if not is_boardwalk:
-                    tile_info = position_map.get((row, col))
-                    if tile_info:
-                        _, tile_obj = tile_info
-                        if tile_obj.get("objectType") == "plant":
-                            slots = tile_obj.get("slots", [])
-                            if slots:
-                                # For multi-slot plants, show the highest mutation count
-                                max_mutations = []
-                                for slot in slots:
-                                    if slot:
-                                        mutations = slot.get("mutations", [])
-                                        if len(mutations) > len(max_mutations):
-                                            max_mutations = mutations
-
-                                if max_mutations:
-                                    self._draw_mutation_indicators(
-                                        self.garden_canvas, x, y, tile_size, max_mutations
-                                    )
+        # Keep markers above freshly drawn mutation indicators
+        if changed:
+            canvas.tag_raise("marker")
 
         # Draw overlays
-        self._draw_pets(self.garden_canvas, player_slot, border_offset, tile_size)
-        self._draw_player(self.garden_canvas, player_slot, border_offset, tile_size)
+        self._draw_pets(canvas, player_slot, border_offset, tile_size)
+        self._draw_player(canvas, player_slot, border_offset, tile_size)
 
     def render_pet_state(self, slot_data):
         """Render the pet state in its own box"""
-        # Save scroll position
-        scroll_pos = self.pet_text.yview()
-        self.pet_text.delete("1.0", tk.END)
-
         # Parse active pet slots
         pet_slots = slot_data.get("petSlots", [])
         active_pets = []
@@ -720,9 +825,11 @@ class MagicGardenGUI:
                 }
                 pets.append(pet_info)
 
+        lines = []
+
         # Active Pets
         if active_pets:
-            self.pet_text.insert("1.0", f"Active Pets ({len(active_pets)}):\n")
+            lines.append(f"Active Pets ({len(active_pets)}):\n")
             for pet in active_pets:
                 species = pet.get("species", "Unknown")
                 xp = pet.get("xp", 0)
@@ -730,23 +837,19 @@ class MagicGardenGUI:
                 abilities = pet.get("abilities", [])
                 mutations = pet.get("mutations", [])
 
-                self.pet_text.insert(tk.END, f"  • {species}")
+                lines.append(f"  • {species}")
                 if mutations:
-                    self.pet_text.insert(tk.END, f" [{', '.join(mutations)}]")
-                self.pet_text.insert(
-                    tk.END, f"\n    XP: {xp:,} | Hunger: {hunger:.0f}\n"
-                )
+                    lines.append(f" [{', '.join(mutations)}]")
+                lines.append(f"\n    XP: {xp:,} | Hunger: {hunger:.0f}\n")
                 if abilities:
-                    self.pet_text.insert(
-                        tk.END, f"    Abilities: {', '.join(abilities)}\n"
-                    )
-            self.pet_text.insert(tk.END, "\n")
+                    lines.append(f"    Abilities: {', '.join(abilities)}\n")
+            lines.append("\n")
         else:
-            self.pet_text.insert("1.0", "Active Pets: None\n\n")
+            lines.append("Active Pets: None\n\n")
 
         # Inventory Pets
         if pets:
-            self.pet_text.insert(tk.END, f"Pets in Inventory ({len(pets)}):\n")
+            lines.append(f"Pets in Inventory ({len(pets)}):\n")
             # Show top 10 pets
             for i, pet in enumerate(pets[:10]):
                 species = pet.get("species", "Unknown")
@@ -757,39 +860,75 @@ class MagicGardenGUI:
                 ability_str = ", ".join(abilities[:2]) if abilities else "None"
                 mutation_str = f" [{', '.join(mutations)}]" if mutations else ""
 
-                self.pet_text.insert(
-                    tk.END,
-                    f"  {i+1:2d}. {species}{mutation_str} (XP: {xp:,}) - {ability_str}\n",
+                lines.append(
+                    f"  {i+1:2d}. {species}{mutation_str} (XP: {xp:,}) - {ability_str}\n"
                 )
             if len(pets) > 10:
-                self.pet_text.insert(
-                    tk.END, f"\n  ... and {len(pets) - 10} more pets\n"
-                )
+                lines.append(f"\n  ... and {len(pets) - 10} more pets\n")
         else:
-            self.pet_text.insert(tk.END, "Pets in Inventory: None\n")
+            lines.append("Pets in Inventory: None\n")
 
-        # Restore scroll position
-        self.pet_text.yview_moveto(scroll_pos[0])
+        self._set_text(self.pet_text, "".join(lines))
+
+    def _set_text(self, widget, text):
+        """Replace a text widget's contents, skipping Tk entirely if unchanged."""
+        if self._widget_text.get(widget) == text:
+            return
+        self._widget_text[widget] = text
+
+        # Keep the scroll position across the rewrite
+        scroll_pos = widget.yview()
+        widget.delete("1.0", tk.END)
+        widget.insert("1.0", text)
+        widget.yview_moveto(scroll_pos[0])
 
     def process_console_queue(self):
         """Append queued console output on the GUI thread."""
+        messages = []
+        popleft = self.console_queue.popleft
         try:
             while True:
-                message = self.console_queue.get_nowait()
-                self.console_log.insert(tk.END, message)
-                self.console_log.see(tk.END)
-        except queue.Empty:
+                messages.append(popleft())
+        except IndexError:
             pass
-        except tk.TclError:
-            return  # Widget destroyed during shutdown
+
+        if messages:
+            try:
+                # One insert and one scroll per tick, however many messages arrived
+                self.console_log.insert(tk.END, "".join(messages))
+
+                # Keep the log bounded so long sessions don't slow the widget down
+                line_count = int(self.console_log.index("end-1c").split(".")[0])
+                if line_count > self.CONSOLE_MAX_LINES:
+                    self.console_log.delete("1.0", f"{self.CONSOLE_TRIM_LINES + 1}.0")
+
+                self.console_log.see(tk.END)
+            except tk.TclError:
+                return  # Widget destroyed during shutdown
 
         try:
             self.root.after(50, self.process_console_queue)
         except tk.TclError:
             pass
 
+    def schedule_update(self):
+        """Schedule the next game state poll on the Tk event loop."""
+        try:
+            self.root.after(self.UPDATE_POLL_MS, self._maybe_update)
+        except tk.TclError:
+            pass  # Window destroyed during shutdown
+
+    def _maybe_update(self):
+        """Run update_ui if the game state changed or the idle interval elapsed."""
+        changed = self.game_state.consume_changed()
+        if changed or time.monotonic() - self._last_render >= self.UPDATE_MAX_IDLE_S:
+            self.update_ui()
+        self.schedule_update()
+
     def update_ui(self):
         """Update UI with current game state"""
+        self._last_render = time.monotonic()
+
         # Player info
         player_id = self.game_state.get("player_id")
         self.player_id_var.set(player_id or "Unknown")
@@ -800,9 +939,9 @@ class MagicGardenGUI:
         player_slot = self.extract_player_data()
 
         if not player_slot:
-            self.inventory_text.delete("1.0", tk.END)
-            self.inventory_text.insert("1.0", "Waiting for game state...\n")
+            self._set_text(self.inventory_text, "Waiting for game state...\n")
             self.garden_canvas.delete("all")
+            self._reset_garden_items()
             self.garden_canvas.create_text(
                 330,
                 205,
@@ -810,9 +949,7 @@ class MagicGardenGUI:
                 fill=self.colors["text_secondary"],
                 font=("Segoe UI", 14),
             )
-            self.pet_text.delete("1.0", tk.END)
-            self.pet_text.insert("1.0", "Waiting for game state...\n")
-            self.root.after(500, self.update_ui)
+            self._set_text(self.pet_text, "Waiting for game state...\n")
             return
 
         slot_data = player_slot.get("data", {})
@@ -826,14 +963,12 @@ class MagicGardenGUI:
         # Render pet state
         self.render_pet_state(slot_data)
 
-        # Save current scroll position for inventory
-        scroll_pos = self.inventory_text.yview()
-        self.inventory_text.delete("1.0", tk.END)
+        lines = []
 
         # Coins
         coins = slot_data.get("coinsCount", 0)
         coins_formatted = f"{coins:,}"
-        self.inventory_text.insert("1.0", f"💰 Coins: {coins_formatted}\n\n")
+        lines.append(f"💰 Coins: {coins_formatted}\n\n")
 
         # Parse inventory items
         inv_data = slot_data.get("inventory", {})
@@ -866,7 +1001,7 @@ class MagicGardenGUI:
         # Format inventory in two columns
         # Seeds
         if seeds:
-            self.inventory_text.insert(tk.END, "🌱 Seeds:\n")
+            lines.append("🌱 Seeds:\n")
             sorted_seeds = sorted(seeds.items())
             # Split into two columns
             mid = (len(sorted_seeds) + 1) // 2
@@ -885,14 +1020,14 @@ class MagicGardenGUI:
                     seed_type, count = col2[i]
                     line += f"    {seed_type:<20} {count:>5}"
 
-                self.inventory_text.insert(tk.END, line + "\n")
-            self.inventory_text.insert(tk.END, "\n")
+                lines.append(line + "\n")
+            lines.append("\n")
         else:
-            self.inventory_text.insert(tk.END, "🌱 Seeds: None\n\n")
+            lines.append("🌱 Seeds: None\n\n")
 
         # Tools
         if tools:
-            self.inventory_text.insert(tk.END, "🔧 Tools:\n")
+            lines.append("🔧 Tools:\n")
             sorted_tools = sorted(tools.items())
             # Split into two columns
             mid = (len(sorted_tools) + 1) // 2
@@ -911,14 +1046,14 @@ class MagicGardenGUI:
                     tool_type, count = col2[i]
                     line += f"    {tool_type:<20} {count:>5}"
 
-                self.inventory_text.insert(tk.END, line + "\n")
-            self.inventory_text.insert(tk.END, "\n")
+                lines.append(line + "\n")
+            lines.append("\n")
         else:
-            self.inventory_text.insert(tk.END, "🔧 Tools: None\n\n")
+            lines.append("🔧 Tools: None\n\n")
 
         # Eggs
         if eggs:
-            self.inventory_text.insert(tk.END, "🥚 Eggs:\n")
+            lines.append("🥚 Eggs:\n")
             sorted_eggs = sorted(eggs.items())
             # Split into two columns
             mid = (len(sorted_eggs) + 1) // 2
@@ -937,14 +1072,14 @@ class MagicGardenGUI:
                     egg_type, count = col2[i]
                     line += f"    {egg_type:<20} {count:>5}"
 
-                self.inventory_text.insert(tk.END, line + "\n")
-            self.inventory_text.insert(tk.END, "\n")
+                lines.append(line + "\n")
+            lines.append("\n")
         else:
-            self.inventory_text.insert(tk.END, "🥚 Eggs: None\n\n")
+            lines.append("🥚 Eggs: None\n\n")
 
         # Produce
         if produce:
-            self.inventory_text.insert(tk.END, f"🌾 Produce: {len(produce)} items\n")
+            lines.append(f"🌾 Produce: {len(produce)} items\n")
             # Count by species
             produce_count = {}
             for item in produce:
@@ -969,36 +1104,32 @@ class MagicGardenGUI:
                     species, count = col2[i]
                     line += f"    {species:<20} {count:>5}"
 
-                self.inventory_text.insert(tk.END, line + "\n")
-            self.inventory_text.insert(tk.END, "\n")
+                lines.append(line + "\n")
+            lines.append("\n")
 
-        # Restore scroll position
-        self.inventory_text.yview_moveto(scroll_pos[0])
+        self._set_text(self.inventory_text, "".join(lines))
 
         # Update Game Stats in separate box
-        self.game_stats_text.delete("1.0", tk.END)
+        stats_lines = []
         stats = slot_data.get("stats", {})
         player_stats_data = stats.get("player", {})
-        self.game_stats_text.insert(
-            "1.0",
-            f"  Crops Harvested: {player_stats_data.get('numCropsHarvested', 0):,}\n",
+        stats_lines.append(
+            f"  Crops Harvested: {player_stats_data.get('numCropsHarvested', 0):,}\n"
         )
-        self.game_stats_text.insert(
-            tk.END,
-            f"  Seeds Planted: {player_stats_data.get('numSeedsPlanted', 0):,}\n",
+        stats_lines.append(
+            f"  Seeds Planted: {player_stats_data.get('numSeedsPlanted', 0):,}\n"
         )
-        self.game_stats_text.insert(
-            tk.END, f"  Pets Sold: {player_stats_data.get('numPetsSold', 0):,}\n"
+        stats_lines.append(
+            f"  Pets Sold: {player_stats_data.get('numPetsSold', 0):,}\n"
         )
-        self.game_stats_text.insert(
-            tk.END, f"  Eggs Hatched: {player_stats_data.get('numEggsHatched', 0):,}\n"
+        stats_lines.append(
+            f"  Eggs Hatched: {player_stats_data.get('numEggsHatched', 0):,}\n"
         )
         total_earnings = player_stats_data.get(
             "totalEarningsSellCrops", 0
         ) + player_stats_data.get("totalEarningsSellPet", 0)
-        self.game_stats_text.insert(
-            tk.END, f"  Total Earnings: {total_earnings:,} coins\n"
-        )
+        stats_lines.append(f"  Total Earnings: {total_earnings:,} coins\n")
+        self._set_text(self.game_stats_text, "".join(stats_lines))
 
         # Update statistics using StringVars
         stats = self.game_state["statistics"]
@@ -1018,16 +1149,6 @@ class MagicGardenGUI:
         room_id = self.game_state.get("room_id", "Unknown")
         self.stats_room_id.set(room_id)
 
-        # Get player count from full_state
-        # Note: game_state["full_state"] returns a deepcopy, so it's thread-safe
-        player_count = 0
-        full_state = self.game_state["full_state"]
-        if full_state:
-            room_data = full_state.get("data", {})
-            players = room_data.get("players", [])
-            # Count non-None players
-            player_count = sum(1 for p in players if p is not None)
+        # Counted under the state lock, without copying full_state
+        player_count = self.game_state.get_player_count()
         self.stats_player_count.set(f"{player_count}/6")
-
-        # Schedule next update
-        self.root.after(500, self.update_ui)
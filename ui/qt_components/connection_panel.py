@@ -101,10 +101,5 @@ class ConnectionPanel(QWidget):
         self.room_id_label.setText(room_id)
 
         # Player count
-        player_count = 0
-        full_state = self.game_state["full_state"]
-        if full_state:
-            room_data = full_state.get("data", {})
-            players = room_data.get("players", [])
-            player_count = sum(1 for p in players if p is not None)
+        player_count = self.game_state.get_player_count()
         self.player_count_label.setText(f"{player_count}/6")
@@ -192,13 +192,8 @@ class MagicGardenGUI(QMainWindow):
         self.pet_panel.update_data(slot_data)
 
         # Update shop panel with quinoa-level data (shops are shared across all players)
-        full_state = self.game_state["full_state"]
-        if full_state:
-            child_state = full_state.get("child", {})
-            quinoa_data = child_state.get("data", {})
-            self.shop_panel.update_data(quinoa_data)
-        else:
-            self.shop_panel.update_data({})
+        # Only the shops subtree is copied; the panel reads nothing else
+        self.shop_panel.update_data({"shops": self.game_state.get_shops()})
 
         # Update journal panel
         self.journal_panel.update_data(slot_data)
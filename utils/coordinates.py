@@ -6,7 +6,7 @@ and server world coordinates.
 """
 
 import random
-from typing import Dict, Optional
+from typing import Dict, Mapping, Optional
 
 from game_state import GameState
 from utils.constants import SPAWN_POSITIONS
@@ -29,20 +29,20 @@ def get_local_spawn_position() -> Dict[str, int]:
     return {"x": 11, "y": 11}
 
 
-def get_slot_base_position(game_state: GameState) -> Dict[str, int]:
+def get_slot_base_position(game_state: GameState) -> Mapping[str, int]:
     """Get the base server coordinates for our user slot.
 
     Args:
         game_state: Game state to query
 
     Returns:
-        Dict with 'x' and 'y' keys for slot base position
+        Read-only mapping with 'x' and 'y' keys for slot base position
     """
     slot_idx = game_state.get_user_slot_index()
     if slot_idx is None or slot_idx >= len(SPAWN_POSITIONS):
         # Default to slot 0 if unknown
-        return SPAWN_POSITIONS[0].copy()
-    return SPAWN_POSITIONS[slot_idx].copy()
+        return SPAWN_POSITIONS[0]
+    return SPAWN_POSITIONS[slot_idx]
 
 
 def convert_local_to_server_coords(